@@ -0,0 +1,127 @@
+import time
+from functools import partial
+from hashlib import md5
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag, urlencode
+from rest_framework.response import Response
+
+CATALOGUE_VERSION_KEY = "catalogue:version"
+
+
+def reviews_version_key(title_id):
+    return f"title:{title_id}:reviews:version"
+
+
+def comments_version_key(review_id):
+    return f"review:{review_id}:comments:version"
+
+
+def get_version(key):
+    """
+    Возвращает версию ресурса — время последнего изменения в миллисекундах.
+    Версия, вытесненная из кэша или истёкшая, начинается заново с текущего
+    момента.
+    """
+    version = cache.get(key)
+    if version is None:
+        cache.add(
+            key, int(time.time() * 1000), settings.CACHE_VERSION_TIMEOUT
+        )
+        version = cache.get(key)
+    return version
+
+
+def bump_version(key):
+    """Сдвигает версию ресурса, делая устаревшими ответы с прежней версией."""
+    version = int(time.time() * 1000)
+    previous = cache.get(key)
+    if previous is not None and previous >= version:
+        version = previous + 1
+    cache.set(key, version, settings.CACHE_VERSION_TIMEOUT)
+
+
+def bump_version_on_commit(key):
+    transaction.on_commit(partial(bump_version, key))
+
+
+def build_response_cache_key(request, versions):
+    """Ключ ответа: хост, путь, упорядоченный query string и версии."""
+    params = sorted(
+        (key, value)
+        for key in request.query_params
+        for value in sorted(request.query_params.getlist(key))
+    )
+    raw_key = f"{request.get_host()}{request.path}?{urlencode(params)}"
+    raw_key += ":" + ":".join(str(version) for version in versions)
+    return md5(raw_key.encode()).hexdigest()
+
+
+class ConditionalGetMixin:
+    """
+    Отдаёт ETag и Last-Modified для list и retrieve по версиям ресурса
+    и отвечает 304, не выполняя запросы к основному queryset.
+    """
+
+    version_keys = ()
+
+    def get_version_keys(self):
+        return self.version_keys
+
+    def get_versions(self):
+        if not hasattr(self, "_versions"):
+            self._versions = [
+                get_version(key) for key in self.get_version_keys()
+            ]
+        return self._versions
+
+    def list(self, request, *args, **kwargs):
+        return self.conditional_response(
+            super().list, request, *args, **kwargs
+        )
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.conditional_response(
+            super().retrieve, request, *args, **kwargs
+        )
+
+    def conditional_response(self, handler, request, *args, **kwargs):
+        versions = self.get_versions()
+        etag = quote_etag(build_response_cache_key(request, versions))
+        last_modified = max(versions) // 1000
+        response = get_conditional_response(
+            request, etag=etag, last_modified=last_modified
+        )
+        if response is None:
+            response = handler(request, *args, **kwargs)
+            if response.status_code != 200:
+                return response
+        response["ETag"] = etag
+        response["Last-Modified"] = http_date(last_modified)
+        return response
+
+
+class CatalogueCacheMixin(ConditionalGetMixin):
+    """Кэширует ответы list и retrieve до следующего изменения каталога."""
+
+    version_keys = (CATALOGUE_VERSION_KEY,)
+
+    def conditional_response(self, handler, request, *args, **kwargs):
+        return super().conditional_response(
+            partial(self.cached_response, handler), request, *args, **kwargs
+        )
+
+    def cached_response(self, handler, request, *args, **kwargs):
+        key = "response:" + build_response_cache_key(
+            request, self.get_versions()
+        )
+        data = cache.get(key)
+        if data is not None:
+            return Response(data)
+        response = handler(request, *args, **kwargs)
+        if response.status_code == 200:
+            cache.set(key, response.data, settings.CATALOGUE_CACHE_TIMEOUT)
+        return response
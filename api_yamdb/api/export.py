@@ -0,0 +1,40 @@
+import json
+from itertools import islice
+
+from rest_framework.utils.encoders import JSONEncoder
+
+from api.serializers import CommentSerializer, ReviewSerializer
+from reviews.models import Comment
+
+CHUNK_SIZE = 500
+
+
+def iter_reviews_ndjson(reviews, chunk_size=CHUNK_SIZE):
+    """
+    Построчно отдаёт отзывы в формате NDJSON с вложенными комментариями.
+    Отзывы читаются курсором пачками, комментарии пачки — одним запросом,
+    поэтому расход памяти не зависит от объёма выгрузки.
+    """
+    reviews = (
+        reviews.select_related("author")
+        .order_by("title_id", "pub_date", "id")
+        .iterator(chunk_size=chunk_size)
+    )
+    while True:
+        chunk = list(islice(reviews, chunk_size))
+        if not chunk:
+            return
+        comments = {review.pk: [] for review in chunk}
+        for comment in (
+            Comment.objects.filter(review__in=chunk)
+            .select_related("author")
+            .order_by("pub_date", "id")
+        ):
+            comments[comment.review_id].append(
+                CommentSerializer(comment).data
+            )
+        for review in chunk:
+            data = dict(ReviewSerializer(review).data)
+            data["title"] = review.title_id
+            data["comments"] = comments[review.pk]
+            yield json.dumps(data, cls=JSONEncoder, ensure_ascii=False) + "\n"
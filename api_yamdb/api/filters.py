@@ -1,25 +1,71 @@
+from django.db.models import Count
 from django_filters import rest_framework as filters
-from reviews.models import Title
+from reviews.models import Category, Genre, GenreToTitle, Title
+
+MATCH_ANY = "any"
+MATCH_ALL = "all"
+
+
+def split_slugs(value):
+    """Разбирает список слагов вида 'drama,comedy'."""
+    return list(
+        dict.fromkeys(
+            slug.strip() for slug in value.split(",") if slug.strip()
+        )
+    )
 
 
 class TitlesFilter(filters.FilterSet):
     """Фильтр произведения."""
 
-    genre = filters.CharFilter(
-        field_name="genre__slug",
-        lookup_expr="icontains",
-    )
-    category = filters.CharFilter(
-        field_name="category__slug",
-        lookup_expr="icontains",
+    genre = filters.CharFilter(method="filter_genre")
+    genre_match = filters.ChoiceFilter(
+        choices=((MATCH_ANY, MATCH_ANY), (MATCH_ALL, MATCH_ALL)),
+        method="filter_noop",
     )
+    category = filters.CharFilter(method="filter_category")
     name = filters.CharFilter(
         field_name="name",
         lookup_expr="icontains",
     )
+    search = filters.CharFilter(method="filter_search")
 
     class Meta:
         """Мета класс фильтра."""
 
-        fields = ("name", "year", "genre", "category")
+        fields = ("name", "year", "genre", "category", "search")
         model = Title
+
+    def filter_noop(self, queryset, name, value):
+        return queryset
+
+    def filter_genre(self, queryset, name, value):
+        """
+        Точный фильтр по одному или нескольким слагам жанра.
+        По умолчанию подходит любой из жанров, при genre_match=all — все.
+        """
+        slugs = split_slugs(value)
+        genre_ids = list(
+            Genre.objects.filter(slug__in=slugs).values_list("id", flat=True)
+        )
+        links = GenreToTitle.objects.filter(genre_id__in=genre_ids)
+        if self.form.cleaned_data.get("genre_match") == MATCH_ALL:
+            if len(genre_ids) < len(slugs):
+                return queryset.none()
+            links = (
+                links.values("title_id")
+                .annotate(matched=Count("genre_id", distinct=True))
+                .filter(matched=len(genre_ids))
+            )
+        return queryset.filter(pk__in=links.values("title_id"))
+
+    def filter_category(self, queryset, name, value):
+        """Точный фильтр по одному или нескольким слагам категории."""
+        category_ids = Category.objects.filter(
+            slug__in=split_slugs(value)
+        ).values_list("id", flat=True)
+        return queryset.filter(category_id__in=list(category_ids))
+
+    def filter_search(self, queryset, name, value):
+        """Полнотекстовый поиск с ранжированием по релевантности."""
+        return queryset.search(value)
@@ -0,0 +1,32 @@
+from django.core.management.base import BaseCommand
+
+from api.export import iter_reviews_ndjson
+from reviews.models import Review
+
+
+class Command(BaseCommand):
+    help = "Выгружает отзывы с комментариями в формате NDJSON."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--title",
+            type=int,
+            action="append",
+            dest="titles",
+            help="id произведения; по умолчанию выгружается весь каталог.",
+        )
+        parser.add_argument(
+            "--output",
+            help="Файл для выгрузки; по умолчанию stdout.",
+        )
+
+    def handle(self, *args, **options):
+        reviews = Review.objects.all()
+        if options["titles"]:
+            reviews = reviews.filter(title_id__in=options["titles"])
+        if not options["output"]:
+            for line in iter_reviews_ndjson(reviews):
+                self.stdout.write(line, ending="")
+            return
+        with open(options["output"], "w", encoding="utf-8") as output:
+            output.writelines(iter_reviews_ndjson(reviews))
@@ -0,0 +1,182 @@
+import datetime
+import json
+
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Q
+from rest_framework.exceptions import NotFound, ValidationError
+from rest_framework.pagination import Cursor, CursorPagination
+
+
+class PositionEncoder(DjangoJSONEncoder):
+    """Сохраняет микросекунды, которые DjangoJSONEncoder отбрасывает."""
+
+    def default(self, o):
+        if isinstance(o, datetime.datetime):
+            return o.isoformat()
+        return super().default(o)
+
+
+class KeysetCursorPagination(CursorPagination):
+    """
+    Keyset-пагинация по всем полям ordering: курсор хранит значения этих
+    полей у крайней строки страницы, следующая страница выбирается
+    условием (a, b) > (x, y) без OFFSET по строкам с равным первым полем.
+    """
+
+    page_size_query_param = "page_size"
+    max_page_size = 100
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+
+        self.base_url = request.build_absolute_uri()
+        self.cursor = self.decode_cursor(request)
+        if self.cursor is not None:
+            self.cursor = self.cursor._replace(
+                position=self.clean_position(
+                    queryset.model, self.cursor.position
+                )
+            )
+        reverse = self.cursor is not None and self.cursor.reverse
+        if self.cursor is not None:
+            queryset = queryset.filter(
+                self.get_keyset_filter(self.cursor.position, reverse)
+            )
+        ordering = [
+            self.flip(field) if reverse else field for field in self.ordering
+        ]
+        results = list(queryset.order_by(*ordering)[: self.page_size + 1])
+        has_more = len(results) > self.page_size
+        self.page = results[: self.page_size]
+        if reverse:
+            self.page.reverse()
+        self.has_next = self.cursor is not None if reverse else has_more
+        self.has_previous = has_more if reverse else self.cursor is not None
+        return self.page
+
+    @staticmethod
+    def flip(field):
+        return field[1:] if field.startswith("-") else f"-{field}"
+
+    def decode_cursor(self, request):
+        cursor = super().decode_cursor(request)
+        if cursor is None:
+            return None
+        try:
+            position = json.loads(cursor.position)
+        except (TypeError, ValueError):
+            raise NotFound(self.invalid_cursor_message)
+        if not isinstance(position, list) or len(position) != len(
+            self.ordering
+        ):
+            raise NotFound(self.invalid_cursor_message)
+        return Cursor(offset=0, reverse=cursor.reverse, position=position)
+
+    def clean_position(self, model, position):
+        """Приводит значения курсора к типам полей ordering."""
+        try:
+            if None in position:
+                raise ValueError
+            return [
+                model._meta.get_field(field.lstrip("-")).to_python(value)
+                for field, value in zip(self.ordering, position)
+            ]
+        except (TypeError, ValueError, DjangoValidationError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def get_keyset_filter(self, position, reverse):
+        """(a > x) OR (a = x AND b > y) для ordering (a, b)."""
+        condition = Q()
+        for idx, field in enumerate(self.ordering):
+            name = field.lstrip("-")
+            lookup = "lt" if field.startswith("-") != reverse else "gt"
+            equal = {
+                previous.lstrip("-"): value
+                for previous, value in zip(self.ordering[:idx], position)
+            }
+            condition |= Q(**equal, **{f"{name}__{lookup}": position[idx]})
+        return condition
+
+    def get_position(self, instance):
+        return json.dumps(
+            [getattr(instance, field.lstrip("-")) for field in self.ordering],
+            cls=PositionEncoder,
+        )
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        if self.page:
+            position = self.get_position(self.page[-1])
+        else:
+            position = json.dumps(
+                self.cursor.position, cls=PositionEncoder
+            )
+        return self.encode_cursor(
+            Cursor(offset=0, reverse=False, position=position)
+        )
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        if self.page:
+            position = self.get_position(self.page[0])
+        else:
+            position = json.dumps(
+                self.cursor.position, cls=PositionEncoder
+            )
+        return self.encode_cursor(
+            Cursor(offset=0, reverse=True, position=position)
+        )
+
+
+class TitleCursorPagination(KeysetCursorPagination):
+    """Keyset-пагинация произведений по паре (name, id)."""
+
+    ordering = ("name", "id")
+
+
+class PubDateCursorPagination(KeysetCursorPagination):
+    """Keyset-пагинация отзывов и комментариев по паре (pub_date, id)."""
+
+    ordering = ("pub_date", "id")
+
+
+class OptionalCursorPaginationMixin:
+    """
+    Включает keyset-пагинацию по параметру ?pagination=cursor. Параметры
+    из cursor_incompatible_params задают свой порядок и с ней несовместимы.
+    """
+
+    cursor_pagination_class = None
+    cursor_incompatible_params = ()
+
+    @property
+    def paginator(self):
+        if not hasattr(self, "_paginator"):
+            params = self.request.query_params
+            if (
+                params.get("pagination") == "cursor"
+                or self.cursor_pagination_class.cursor_query_param in params
+            ):
+                conflicts = [
+                    param
+                    for param in self.cursor_incompatible_params
+                    if param in params
+                ]
+                if conflicts:
+                    raise ValidationError(
+                        {
+                            "pagination": [
+                                "Keyset-пагинация несовместима с "
+                                f"параметрами: {', '.join(conflicts)}."
+                            ]
+                        }
+                    )
+                self._paginator = self.cursor_pagination_class()
+            else:
+                return super().paginator
+        return self._paginator
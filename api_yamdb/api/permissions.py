@@ -23,3 +23,12 @@ class IsAuthorOrReadOnly(permissions.BasePermission):
             or request.user.is_moderator
             or request.user.is_admin
         )
+
+
+class IsModeratorOrAdmin(permissions.BasePermission):
+    """Доступ только для модераторов и администраторов."""
+
+    def has_permission(self, request, view):
+        return request.user.is_authenticated and (
+            request.user.is_moderator or request.user.is_admin
+        )
@@ -1,4 +1,7 @@
+from django.conf import settings
+from django.utils.encoding import smart_str
 from rest_framework import serializers
+from reviews.constants import MAX_SCORE, MIN_SCORE
 from reviews.models import Category, Comment, Genre, Review, Title
 
 
@@ -35,6 +38,21 @@ class TitleLRSerializer(serializers.ModelSerializer):
             "rating",
         )
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        requested = self.context.get("fields")
+        if requested:
+            for field in set(self.fields) - set(requested):
+                self.fields.pop(field)
+        expand = self.context.get("expand", ())
+        if "reviews" in expand:
+            self.fields["reviews"] = EmbeddedReviewSerializer(
+                source="embedded_reviews",
+                many=True,
+                read_only=True,
+                with_comments="reviews.comments" in expand,
+            )
+
 
 class TitleCPDSerializer(serializers.ModelSerializer):
     """Serializer для Create, Partial Update and Destroy."""
@@ -52,7 +70,72 @@ class TitleCPDSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Title
-        fields = "__all__"
+        exclude = ("score_sum", "reviews_count", "rating", "weighted_rating")
+
+
+class PreloadedSlugRelatedField(serializers.SlugRelatedField):
+    """Ищет объект по slug в словаре, заранее загруженном в контекст."""
+
+    def __init__(self, context_key, **kwargs):
+        self.context_key = context_key
+        super().__init__(**kwargs)
+
+    def to_internal_value(self, data):
+        try:
+            return self.context[self.context_key][smart_str(data)]
+        except KeyError:
+            self.fail(
+                "does_not_exist", slug_name=self.slug_field, value=data
+            )
+        except (TypeError, ValueError):
+            self.fail("invalid")
+
+
+class TitleBulkSerializer(TitleCPDSerializer):
+    """Serializer для массового создания произведений."""
+
+    category = PreloadedSlugRelatedField(
+        "categories", slug_field="slug", queryset=Category.objects.none()
+    )
+    genre = PreloadedSlugRelatedField(
+        "genres",
+        slug_field="slug",
+        queryset=Genre.objects.none(),
+        many=True,
+        allow_null=False,
+        allow_empty=False,
+    )
+
+
+class TitleStatsSerializer(serializers.BaseSerializer):
+    """Статистика оценок произведения по гистограмме {оценка: число}."""
+
+    def to_representation(self, histogram):
+        scores = range(MIN_SCORE, MAX_SCORE + 1)
+        counts = [histogram.get(score, 0) for score in scores]
+        total = sum(counts)
+        if not total:
+            mean = median = None
+        else:
+            mean = sum(s * c for s, c in zip(scores, counts)) / total
+            median = (
+                self.nth_score(scores, counts, (total - 1) // 2)
+                + self.nth_score(scores, counts, total // 2)
+            ) / 2
+        return {
+            "histogram": {str(s): c for s, c in zip(scores, counts)},
+            "mean": mean,
+            "median": median,
+            "reviews_count": total,
+        }
+
+    @staticmethod
+    def nth_score(scores, counts, index):
+        """Оценка с порядковым номером index в отсортированной выборке."""
+        for score, count in zip(scores, counts):
+            if index < count:
+                return score
+            index -= count
 
 
 class ReviewSerializer(serializers.ModelSerializer):
@@ -64,22 +147,16 @@ class ReviewSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Review
-        fields = ("id", "text", "author", "score", "pub_date")
+        fields = (
+            "id",
+            "text",
+            "author",
+            "score",
+            "pub_date",
+            "comments_count",
+        )
         read_only_fields = ("author",)
 
-    def validate(self, data):
-        request = self.context.get("request")
-        if request and request.method == "POST":
-            author = request.user
-            title_id = self.context["view"].kwargs.get("title_id")
-            if Review.objects.filter(
-                author=author, title_id=title_id
-            ).exists():
-                raise serializers.ValidationError(
-                    "Вы уже оставляли отзыв на это произведение."
-                )
-        return data
-
 
 class CommentSerializer(serializers.ModelSerializer):
     """Сериализатор для модели Comment."""
@@ -92,3 +169,41 @@ class CommentSerializer(serializers.ModelSerializer):
         model = Comment
         fields = ("id", "text", "author", "pub_date")
         read_only_fields = ("author",)
+
+
+class BulkModerationSerializer(serializers.Serializer):
+    """id отзывов и комментариев для массового удаления."""
+
+    reviews = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        required=False,
+        default=list,
+    )
+    comments = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        required=False,
+        default=list,
+    )
+
+    def validate(self, data):
+        if not data["reviews"] and not data["comments"]:
+            raise serializers.ValidationError(
+                "Укажите id отзывов или комментариев."
+            )
+        limit = settings.MODERATION_BULK_LIMIT
+        if len(data["reviews"]) + len(data["comments"]) > limit:
+            raise serializers.ValidationError(
+                f"Можно удалить не больше {limit} объектов за раз."
+            )
+        return data
+
+
+class EmbeddedReviewSerializer(ReviewSerializer):
+    """Отзыв, встроенный в карточку произведения по ?expand=reviews."""
+
+    def __init__(self, *args, with_comments=False, **kwargs):
+        super().__init__(*args, **kwargs)
+        if with_comments:
+            self.fields["comments"] = CommentSerializer(
+                source="embedded_comments", many=True, read_only=True
+            )
@@ -0,0 +1,84 @@
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from api.cache import (
+    CATALOGUE_VERSION_KEY,
+    bump_version_on_commit,
+    comments_version_key,
+    reviews_version_key,
+)
+from reviews.models import Comment, GenreToTitle, Review, Title
+from reviews.rating_queue import ratings_recalculated
+from reviews.signals import counters_recalculated, defer
+
+
+@receiver(post_save, sender=Title)
+@receiver(post_delete, sender=Title)
+@receiver(post_save, sender=GenreToTitle)
+@receiver(post_delete, sender=GenreToTitle)
+@receiver(m2m_changed, sender=GenreToTitle)
+def invalidate_catalogue_cache(sender, **kwargs):
+    """Сбрасывает кэш каталога после фиксации транзакции."""
+    bump_version_on_commit(CATALOGUE_VERSION_KEY)
+
+
+@receiver(post_delete, sender=Title)
+def invalidate_title_reviews_cache(sender, instance, **kwargs):
+    """Удалённое произведение без отзывов не должно отдаваться из кэша."""
+    bump_version_on_commit(reviews_version_key(instance.pk))
+
+
+@receiver(ratings_recalculated, sender=Title)
+def invalidate_recalculated_ratings(sender, **kwargs):
+    """Фоновый пересчёт рейтинга меняет ответы каталога."""
+    bump_version_on_commit(CATALOGUE_VERSION_KEY)
+
+
+@receiver(post_save, sender=Review)
+@receiver(post_delete, sender=Review)
+def invalidate_review_cache(sender, instance, **kwargs):
+    """Отзыв меняет рейтинг в каталоге и список отзывов произведения."""
+    bump_version_on_commit(CATALOGUE_VERSION_KEY)
+    bump_version_on_commit(reviews_version_key(instance.title_id))
+
+
+@receiver(post_delete, sender=Review)
+def invalidate_review_comments_cache(sender, instance, **kwargs):
+    """Список комментариев удалённого отзыва должен отдавать 404, а не 304."""
+    bump_version_on_commit(comments_version_key(instance.pk))
+
+
+@receiver(post_save, sender=Comment)
+@receiver(post_delete, sender=Comment)
+def invalidate_comment_cache(sender, instance, **kwargs):
+    """
+    Комментарий входит в счётчик списка отзывов и во встроенные
+    комментарии карточки произведения, поэтому сбрасывает и их.
+    """
+    bump_version_on_commit(comments_version_key(instance.review_id))
+    if defer("reviews", instance.review_id):
+        # Версии отзывов сдвигаются разом на выходе из deferred_counters.
+        return
+    if Comment.review.is_cached(instance):
+        title_id = instance.review.title_id
+    else:
+        title_id = (
+            Review.objects.filter(pk=instance.review_id)
+            .values_list("title_id", flat=True)
+            .first()
+        )
+    if title_id is not None:
+        bump_version_on_commit(reviews_version_key(title_id))
+
+
+@receiver(counters_recalculated, sender=Title)
+def invalidate_recalculated_counters(sender, title_ids, review_ids, **kwargs):
+    """Сбрасывает списки отзывов после пакетного пересчёта счётчиков."""
+    title_ids = set(title_ids)
+    title_ids.update(
+        Review.objects.filter(pk__in=review_ids).values_list(
+            "title_id", flat=True
+        )
+    )
+    for title_id in title_ids:
+        bump_version_on_commit(reviews_version_key(title_id))
@@ -5,6 +5,7 @@ from api.views import (
     CategoryViewSet,
     CommentViewSet,
     GenreViewSet,
+    ModerationView,
     ReviewViewSet,
     TitleViewSet,
 )
@@ -35,6 +36,7 @@ auth_patterns = [
 ]
 
 urlpatterns = [
+    path("v1/moderation/delete/", ModerationView.as_view()),
     path("v1/", include(router.urls)),
     path("v1/", include(auth_patterns)),
 ]
@@ -1,22 +1,74 @@
-from django.db.models import Avg
+from django.conf import settings
+from django.core.cache import cache
+from django.db import IntegrityError, connection, transaction
+from django.db.models import Count, OuterRef, Subquery
+from django.http import StreamingHttpResponse
 from django.shortcuts import get_object_or_404
 
-from rest_framework import filters, mixins, viewsets
+from rest_framework import filters, mixins, status, views, viewsets
+from rest_framework.decorators import action
+from rest_framework.exceptions import AuthenticationFailed, ValidationError
 from rest_framework.permissions import AllowAny, IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
 from django_filters.rest_framework import DjangoFilterBackend
 
+from api.cache import (
+    CATALOGUE_VERSION_KEY,
+    CatalogueCacheMixin,
+    ConditionalGetMixin,
+    bump_version_on_commit,
+    comments_version_key,
+    get_version,
+    reviews_version_key,
+)
+from api.export import iter_reviews_ndjson
 from api.filters import TitlesFilter
-from api.permissions import IsAdminOrAnyReadOnly, IsAuthorOrReadOnly
+from api.pagination import (
+    OptionalCursorPaginationMixin,
+    PubDateCursorPagination,
+    TitleCursorPagination,
+)
+from api.permissions import (
+    IsAdminOrAnyReadOnly,
+    IsAuthorOrReadOnly,
+    IsModeratorOrAdmin,
+)
 from api.serializers import (
+    BulkModerationSerializer,
     CategorySerializer,
     CommentSerializer,
     GenreSerializer,
     ReviewSerializer,
+    TitleBulkSerializer,
     TitleCPDSerializer,
     TitleLRSerializer,
+    TitleStatsSerializer,
 )
 
-from reviews.models import Category, Comment, Genre, Review, Title
+from custom_users.constants import MESSAGE_USER_NOT_FOUND
+from custom_users.models import User
+from reviews.models import (
+    Category,
+    Comment,
+    Genre,
+    GenreToTitle,
+    Review,
+    Title,
+)
+from reviews.signals import deferred_counters
+
+
+class DeferredCountersDestroyMixin:
+    """
+    Удаляет объект с каскадом в одной транзакции: счётчики и версии кэша
+    затронутых произведений и отзывов пересчитываются один раз, а не на
+    каждой каскадно удалённой строке.
+    """
+
+    def perform_destroy(self, instance):
+        with transaction.atomic(), deferred_counters():
+            super().perform_destroy(instance)
 
 
 class CreateDestroyViewSet(
@@ -46,38 +98,356 @@ class CategoryViewSet(CreateDestroyViewSet):
     search_fields = ("name",)
 
 
-class TitleViewSet(viewsets.ModelViewSet):
-    queryset = Title.objects.annotate(rating=Avg("reviews__score")).order_by(
-        "name"
-    )
+READ_ACTIONS = ("list", "retrieve", "top")
+EXPANSIONS = ("reviews", "reviews.comments")
+TOP_ORDERINGS = {
+    "rating": ("-weighted_rating", "-reviews_count", "id"),
+    "reviews": ("-reviews_count", "-weighted_rating", "id"),
+}
+
+
+class TitleViewSet(
+    DeferredCountersDestroyMixin,
+    OptionalCursorPaginationMixin,
+    CatalogueCacheMixin,
+    viewsets.ModelViewSet,
+):
+    queryset = Title.objects.order_by("name", "id")
     serializer_class = TitleCPDSerializer
     filter_backends = (DjangoFilterBackend,)
     http_method_names = ("get", "post", "patch", "delete", "head", "options")
     filterset_class = TitlesFilter
     permission_classes = (IsAdminOrAnyReadOnly,)
+    cursor_pagination_class = TitleCursorPagination
+    # ?search= упорядочивает по релевантности, а не по (name, id).
+    cursor_incompatible_params = ("search",)
+    lookup_value_regex = r"\d+"
+
+    def get_requested_fields(self):
+        """Поля из ?fields=, по умолчанию — все поля TitleLRSerializer."""
+        all_fields = TitleLRSerializer.Meta.fields
+        value = self.request.query_params.get("fields")
+        if not value:
+            return all_fields
+        fields = [field.strip() for field in value.split(",") if field.strip()]
+        unknown = ", ".join(sorted(set(fields) - set(all_fields)))
+        if unknown:
+            raise ValidationError(
+                {"fields": [f"Неизвестные поля: {unknown}."]}
+            )
+        return tuple(field for field in all_fields if field in fields)
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action not in READ_ACTIONS:
+            return queryset
+        fields = self.get_requested_fields()
+        if "category" in fields:
+            queryset = queryset.select_related("category")
+        if "genre" in fields:
+            queryset = queryset.prefetch_related("genre")
+        # name и id нужны для сортировки и keyset-пагинации.
+        return queryset.only(
+            "id",
+            "name",
+            *(field for field in fields if field not in ("id", "genre")),
+        )
+
+    def get_expand(self):
+        """Встраиваемые связи из ?expand=, только для карточки произведения."""
+        value = self.request.query_params.get("expand")
+        if not value or self.action != "retrieve":
+            return ()
+        expand = {item.strip() for item in value.split(",") if item.strip()}
+        unknown = ", ".join(sorted(expand - set(EXPANSIONS)))
+        if unknown:
+            raise ValidationError(
+                {"expand": [f"Неизвестные связи: {unknown}."]}
+            )
+        if "reviews.comments" in expand:
+            expand.add("reviews")
+        return tuple(item for item in EXPANSIONS if item in expand)
+
+    def get_version_keys(self):
+        keys = super().get_version_keys()
+        if self.get_expand():
+            keys += (reviews_version_key(self.kwargs["pk"]),)
+        return keys
+
+    def get_object(self):
+        """Догружает встроенные отзывы и комментарии двумя запросами."""
+        title = super().get_object()
+        expand = self.get_expand()
+        if not expand:
+            return title
+        limit = settings.EXPAND_ITEMS_LIMIT
+        title.embedded_reviews = list(
+            Review.objects.filter(title=title)
+            .select_related("author")
+            .order_by("pub_date", "id")[:limit]
+        )
+        if "reviews.comments" in expand:
+            comments = {review.pk: [] for review in title.embedded_reviews}
+            first_comments = (
+                Comment.objects.filter(review_id=OuterRef("review_id"))
+                .order_by("pub_date", "id")
+                .values("pk")[:limit]
+            )
+            for comment in (
+                Comment.objects.filter(
+                    review_id__in=comments, pk__in=Subquery(first_comments)
+                )
+                .select_related("author")
+                .order_by("pub_date", "id")
+            ):
+                comments[comment.review_id].append(comment)
+            for review in title.embedded_reviews:
+                review.embedded_comments = comments[review.pk]
+        return title
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        if self.action in READ_ACTIONS:
+            context["fields"] = self.get_requested_fields()
+            context["expand"] = self.get_expand()
+        return context
 
     def get_serializer_class(self):
-        if self.action in ("list", "retrieve"):
+        if self.action in READ_ACTIONS:
             return TitleLRSerializer
+        if self.action == "bulk":
+            return TitleBulkSerializer
+        if self.action == "stats":
+            return TitleStatsSerializer
         return TitleCPDSerializer
 
+    @action(detail=False, methods=["get"])
+    def top(self, request):
+        """
+        Лучшие произведения по взвешенному рейтингу (?by=rating)
+        или по числу отзывов (?by=reviews); работают фильтры списка.
+        """
+        return self.conditional_response(self.get_top_response, request)
+
+    def get_top_response(self, request):
+        ordering = TOP_ORDERINGS.get(request.query_params.get("by", "rating"))
+        if ordering is None:
+            raise ValidationError(
+                {"by": [f"Допустимые значения: {', '.join(TOP_ORDERINGS)}."]}
+            )
+        limit = request.query_params.get("limit", api_settings.PAGE_SIZE)
+        try:
+            limit = int(limit)
+        except ValueError:
+            raise ValidationError({"limit": ["Ожидается целое число."]})
+        limit = max(1, min(limit, settings.TOP_TITLES_MAX_LIMIT))
+        titles = (
+            self.filter_queryset(self.get_queryset())
+            .filter(reviews_count__gt=0)
+            .order_by(*ordering)[:limit]
+        )
+        return Response(self.get_serializer(titles, many=True).data)
+
+    @action(detail=True, methods=["get"])
+    def stats(self, request, pk=None):
+        """Гистограмма оценок, среднее, медиана и число отзывов."""
+        pk = int(pk)
+        reviews_version = get_version(reviews_version_key(pk))
+        key = f"title:{pk}:stats:{reviews_version}"
+        histogram = cache.get(key)
+        if histogram is None:
+            histogram = dict(
+                Review.objects.filter(title_id=pk)
+                .order_by()
+                .values("score")
+                .annotate(count=Count("pk"))
+                .values_list("score", "count")
+            )
+            if not histogram:
+                get_object_or_404(Title.objects.only("id"), pk=pk)
+            cache.set(key, histogram, settings.CATALOGUE_CACHE_TIMEOUT)
+        return Response(self.get_serializer(histogram).data)
+
+    @staticmethod
+    def load_bulk_slugs(items):
+        """Загружает все категории и жанры пачки двумя запросами."""
+        category_slugs, genre_slugs = set(), set()
+        for item in items:
+            if not isinstance(item, dict):
+                continue
+            if isinstance(item.get("category"), str):
+                category_slugs.add(item["category"])
+            if isinstance(item.get("genre"), list):
+                genre_slugs.update(
+                    slug for slug in item["genre"] if isinstance(slug, str)
+                )
+        return {
+            "categories": Category.objects.in_bulk(
+                category_slugs, field_name="slug"
+            ),
+            "genres": Genre.objects.in_bulk(genre_slugs, field_name="slug"),
+        }
+
+    @action(detail=False, methods=["post"])
+    def bulk(self, request):
+        """Создаёт список произведений целиком или не создаёт ни одного."""
+        if not isinstance(request.data, list):
+            return Response(
+                {"non_field_errors": ["Ожидается список произведений."]},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if len(request.data) > settings.TITLES_BULK_LIMIT:
+            return Response(
+                {
+                    "non_field_errors": [
+                        "Можно создать не больше "
+                        f"{settings.TITLES_BULK_LIMIT} произведений за раз."
+                    ]
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        serializer = self.get_serializer_class()(
+            data=request.data,
+            many=True,
+            context={
+                **self.get_serializer_context(),
+                **self.load_bulk_slugs(request.data),
+            },
+        )
+        serializer.is_valid(raise_exception=True)
+        items = serializer.validated_data
+        with transaction.atomic():
+            titles = self.bulk_create_titles(
+                [
+                    Title(
+                        **{
+                            field: value
+                            for field, value in item.items()
+                            if field != "genre"
+                        }
+                    )
+                    for item in items
+                ]
+            )
+            GenreToTitle.objects.bulk_create(
+                GenreToTitle(title=title, genre=genre)
+                for title, item in zip(titles, items)
+                for genre in dict.fromkeys(item["genre"])
+            )
+            bump_version_on_commit(CATALOGUE_VERSION_KEY)
+        for title, item in zip(titles, items):
+            item["id"] = title.pk
+        return Response(
+            self.get_serializer(items, many=True).data,
+            status=status.HTTP_201_CREATED,
+        )
+
+    @staticmethod
+    def bulk_create_titles(titles):
+        if not (
+            connection.features.can_return_rows_from_bulk_insert
+            or connection.vendor == "sqlite"
+        ):
+            for title in titles:
+                title.save(force_insert=True)
+            return titles
+        Title.objects.bulk_create(titles)
+        if titles and titles[0].pk is None:
+            # SQLite не возвращает id из bulk_create, но держит блокировку
+            # на запись до конца транзакции: последние id принадлежат пачке.
+            ids = Title.objects.order_by("-id").values_list("id", flat=True)
+            for title, pk in zip(titles, list(ids[: len(titles)])[::-1]):
+                title.pk = pk
+        return titles
+
+
+class TitleReviewResolverMixin:
+    """
+    Разрешает вложенные маршруты titles/<title_id>/reviews/<review_id>/.
+    Найденные объекты кэшируются на view и переиспользуются
+    в правах доступа, валидации и создании.
+    """
 
-class ReviewViewSet(viewsets.ModelViewSet):
+    def get_title_id(self):
+        return int(self.kwargs["title_id"])
+
+    def get_review_id(self):
+        return int(self.kwargs["review_id"])
+
+    def get_title(self):
+        if not hasattr(self, "_title"):
+            self._title = get_object_or_404(Title, pk=self.get_title_id())
+        return self._title
+
+    def get_review(self):
+        """Отзыв из URL, проверенный на принадлежность произведению."""
+        if not hasattr(self, "_review"):
+            self._review = get_object_or_404(
+                Review.objects.select_related("title"),
+                pk=self.get_review_id(),
+                title_id=self.get_title_id(),
+            )
+            self._title = self._review.title
+        return self._review
+
+
+class ReviewViewSet(
+    DeferredCountersDestroyMixin,
+    TitleReviewResolverMixin,
+    OptionalCursorPaginationMixin,
+    ConditionalGetMixin,
+    viewsets.ModelViewSet,
+):
     serializer_class = ReviewSerializer
     http_method_names = ("get", "post", "patch", "delete", "head", "options")
+    cursor_pagination_class = PubDateCursorPagination
 
-    def get_title_id(self):
-        return self.kwargs.get("title_id")
+    def get_version_keys(self):
+        return (reviews_version_key(self.get_title_id()),)
 
     def get_queryset(self):
         """Возвращает отзывы, относящиеся к конкретному произведению."""
-        title_id = self.get_title_id()
-        return Review.objects.filter(title_id=title_id)
+        return Review.objects.filter(
+            title_id=self.get_title_id()
+        ).select_related("author")
 
     def perform_create(self, serializer):
-        title_id = self.get_title_id()
-        title = get_object_or_404(Title, pk=title_id)
-        serializer.save(title=title, author=self.request.user)
+        """
+        Вставляет отзыв без предварительных проверок: повтор отзыва и
+        несуществующее произведение ловятся ограничениями БД.
+        """
+        try:
+            serializer.save(
+                title_id=self.get_title_id(), author=self.request.user
+            )
+        except IntegrityError:
+            title = self.get_title()
+            author_id = self.request.user.pk
+            if Review.objects.filter(
+                title=title, author_id=author_id
+            ).exists():
+                raise ValidationError(
+                    {
+                        api_settings.NON_FIELD_ERRORS_KEY: [
+                            "Вы уже оставляли отзыв на это произведение."
+                        ]
+                    }
+                )
+            # Токен с утверждениями мог пережить удаление пользователя.
+            if not User.objects.filter(pk=author_id).exists():
+                raise AuthenticationFailed(
+                    MESSAGE_USER_NOT_FOUND, code="user_not_found"
+                )
+            raise
+
+    @action(detail=False, methods=["get"])
+    def export(self, request, title_id=None):
+        """Потоковая выгрузка отзывов произведения с комментариями в NDJSON."""
+        title = self.get_title()
+        return StreamingHttpResponse(
+            iter_reviews_ndjson(Review.objects.filter(title=title)),
+            content_type="application/x-ndjson",
+        )
 
     def get_permissions(self):
         """Определяем права доступа в зависимости от действия."""
@@ -90,27 +460,28 @@ class ReviewViewSet(viewsets.ModelViewSet):
         return [permission() for permission in permission_classes]
 
 
-class CommentViewSet(viewsets.ModelViewSet):
+class CommentViewSet(
+    TitleReviewResolverMixin,
+    OptionalCursorPaginationMixin,
+    ConditionalGetMixin,
+    viewsets.ModelViewSet,
+):
     serializer_class = CommentSerializer
     http_method_names = ("get", "post", "patch", "delete", "head", "options")
+    cursor_pagination_class = PubDateCursorPagination
 
-    def get_review_id(self):
-        return self.kwargs.get("review_id")
-
-    def get_title_id(self):
-        return self.kwargs.get("title_id")
+    def get_version_keys(self):
+        return (comments_version_key(self.get_review_id()),)
 
     def get_queryset(self):
         """Возвращает комментарии, относящиеся к конкретному отзыву."""
-        return Comment.objects.filter(review_id=self.get_review_id())
+        return Comment.objects.filter(
+            review=self.get_review()
+        ).select_related("author")
 
     def perform_create(self, serializer):
         """Присваиваем авторство и связанный отзыв при создании комментария."""
-        title = get_object_or_404(Title, pk=self.get_title_id())
-        review = get_object_or_404(
-            Review, pk=self.get_review_id(), title_id=title
-        )
-        serializer.save(review=review, author=self.request.user)
+        serializer.save(review=self.get_review(), author=self.request.user)
 
     def get_permissions(self):
         """Определяем права доступа в зависимости от действия."""
@@ -121,3 +492,30 @@ class CommentViewSet(viewsets.ModelViewSet):
         else:
             permission_classes = [IsAuthenticated, IsAuthorOrReadOnly]
         return [permission() for permission in permission_classes]
+
+
+class ModerationView(views.APIView):
+    """Массовое удаление отзывов и комментариев модератором."""
+
+    permission_classes = (IsModeratorOrAdmin,)
+
+    def post(self, request):
+        serializer = BulkModerationSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        with transaction.atomic(), deferred_counters():
+            _, comments = Comment.objects.filter(
+                pk__in=serializer.validated_data["comments"]
+            ).delete()
+            _, reviews = Review.objects.filter(
+                pk__in=serializer.validated_data["reviews"]
+            ).delete()
+        return Response(
+            {
+                "reviews": reviews.get(Review._meta.label, 0),
+                "comments": (
+                    comments.get(Comment._meta.label, 0)
+                    + reviews.get(Comment._meta.label, 0)
+                ),
+            },
+            status=status.HTTP_200_OK,
+        )
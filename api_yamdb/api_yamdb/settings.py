@@ -71,6 +71,36 @@ DATABASES = {
 }
 
 
+# Cache
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "api_yamdb",
+    }
+}
+
+# время жизни закэшированных ответов каталога, сек.
+CATALOGUE_CACHE_TIMEOUT = 60 * 5
+# время жизни версий ресурсов для ETag, сек.: LocMemCache у каждого процесса
+# свой, и запись сдвигает версию только в обработавшем её процессе, поэтому
+# остальные процессы отдают устаревшие 304 не дольше этого срока
+CACHE_VERSION_TIMEOUT = CATALOGUE_CACHE_TIMEOUT
+# максимальный размер пачки при массовом создании произведений
+TITLES_BULK_LIMIT = 500
+# максимальное число объектов в одном запросе массовой модерации
+MODERATION_BULK_LIMIT = 500
+# задержка фонового пересчёта рейтинга, сек.; None — пересчёт при записи
+RATING_RECALC_DELAY = None
+# априорные голоса байесовского рейтинга для списков лучших произведений
+RATING_PRIOR_WEIGHT = 5
+RATING_PRIOR_MEAN = 5.5
+# максимальная длина списка лучших произведений
+TOP_TITLES_MAX_LIMIT = 100
+# сколько отзывов и комментариев к каждому встраивать по ?expand=
+EXPAND_ITEMS_LIMIT = 10
+
+
 # Password validation
 
 AUTH_PASSWORD_VALIDATORS = [
@@ -117,10 +147,15 @@ REST_FRAMEWORK = {
         "rest_framework.permissions.AllowAny",
     ],
     "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "custom_users.authentication.ClaimsJWTAuthentication",
     ),
     "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
     "PAGE_SIZE": 10,
+    # запросы в корзине токенов на адрес клиента и на username/email
+    "DEFAULT_THROTTLE_RATES": {
+        "signup": "10/min",
+        "token": "20/min",
+    },
 }
 
 SIMPLE_JWT = {
@@ -128,6 +163,13 @@ SIMPLE_JWT = {
     "AUTH_HEADER_TYPES": ("Bearer",),
 }
 
+# размер и время жизни (в секундах) кэша строк пользователей в процессе
+USER_CACHE_SIZE = 1024
+USER_CACHE_TTL = 30
+
+# сколько имён пользователей возвращает автодополнение
+USERNAME_AUTOCOMPLETE_LIMIT = 10
+
 RESERVED_NAME = "me"
 # сообщения об ошибках
 MESSAGE_FOR_RESERVED_NAME = 'Имя пользователя "me" использовать нельзя!'
@@ -137,3 +179,10 @@ EMAIL_BACKEND = "django.core.mail.backends.filebased.EmailBackend"
 EMAIL_FILE_PATH = os.path.join(BASE_DIR, "sent_emails")
 
 ADMIN_EMAIL = "admin@mail.ru"
+# задержка фоновой отправки писем, сек.: письма за это время уходят пачкой
+EMAIL_OUTBOX_DELAY = 1
+# отправлять очередь писем в запросе после фиксации транзакции (для тестов)
+EMAIL_OUTBOX_SYNC = False
+# пауза перед повторной попыткой отправки письма, сек.
+EMAIL_OUTBOX_RETRY_DELAY = 60
+EMAIL_OUTBOX_MAX_ATTEMPTS = 5
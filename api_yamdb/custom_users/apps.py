@@ -1,6 +1,15 @@
 from django.apps import AppConfig
+from django.conf import settings
 
 
 class CustomUsersConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "custom_users"
+
+    def ready(self):
+        import custom_users.signals  # noqa: F401
+        from custom_users.outbox import worker
+
+        if not settings.EMAIL_OUTBOX_SYNC:
+            # Письма могли остаться в очереди после перезапуска.
+            worker.wake()
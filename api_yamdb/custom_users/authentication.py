@@ -0,0 +1,44 @@
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import AccessToken
+
+from custom_users.constants import MESSAGE_USER_NOT_FOUND, TOKEN_CLAIMS
+from custom_users.models import ClaimsUser, get_cached_user
+
+
+class ClaimsAccessToken(AccessToken):
+    """Access-токен с утверждениями, которых хватает для проверки прав."""
+
+    @classmethod
+    def for_user(cls, user):
+        token = super().for_user(user)
+        for name in TOKEN_CLAIMS:
+            token[name] = getattr(user, name)
+        return token
+
+
+class ClaimsJWTAuthentication(JWTAuthentication):
+    """
+    Восстанавливает пользователя из утверждений токена без запроса к БД.
+    Токены без утверждений проверяются по кэшу строк пользователей.
+    """
+
+    def get_user(self, validated_token):
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken("Токен не содержит идентификатор пользователя.")
+        if all(name in validated_token for name in TOKEN_CLAIMS):
+            return ClaimsUser.from_claims(user_id, validated_token)
+        user = get_cached_user(user_id)
+        if user is None:
+            raise AuthenticationFailed(
+                MESSAGE_USER_NOT_FOUND, code="user_not_found"
+            )
+        if not user.is_active:
+            raise AuthenticationFailed(
+                "Пользователь неактивен.", code="user_inactive"
+            )
+        return user
@@ -1,2 +1,6 @@
 MAX_LENGTH_EMAIL = 254
 MAX_LENGTH_NAME = 150
+CONFIRMATION_CODE_LENGTH = 32
+# утверждения access-токена, которых хватает для проверки прав
+TOKEN_CLAIMS = ("username", "role", "is_staff", "is_superuser")
+MESSAGE_USER_NOT_FOUND = "Пользователь не найден."
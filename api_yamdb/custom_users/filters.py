@@ -0,0 +1,54 @@
+import operator
+import sys
+from functools import reduce
+
+from django.db.models import Q
+from rest_framework.compat import distinct
+from rest_framework.filters import SearchFilter
+
+
+class PrefixSearchFilter(SearchFilter):
+    """
+    SearchFilter, в котором поиск по началу значения ("^") идёт диапазоном
+    по полю: так используется обычный индекс, а не перебор строк в LIKE.
+    Поиск по началу учитывает регистр, как и уникальность username.
+    """
+
+    def get_search_query(self, search_field, search_term):
+        if not search_field.startswith("^"):
+            lookup = self.construct_search(search_field)
+            return Q(**{lookup: search_term})
+        field = search_field[1:]
+        query = Q(
+            **{
+                f"{field}__gte": search_term,
+                f"{field}__startswith": search_term,
+            }
+        )
+        last = ord(search_term[-1])
+        if last < sys.maxunicode:
+            upper = search_term[:-1] + chr(last + 1)
+            query &= Q(**{f"{field}__lt": upper})
+        return query
+
+    def filter_queryset(self, request, queryset, view):
+        search_fields = self.get_search_fields(view, request)
+        search_terms = self.get_search_terms(request)
+        if not search_fields or not search_terms:
+            return queryset
+
+        base = queryset
+        conditions = [
+            reduce(
+                operator.or_,
+                (
+                    self.get_search_query(str(search_field), search_term)
+                    for search_field in search_fields
+                ),
+            )
+            for search_term in search_terms
+        ]
+        queryset = queryset.filter(reduce(operator.and_, conditions))
+        if self.must_call_distinct(queryset, search_fields):
+            queryset = distinct(queryset, base)
+        return queryset
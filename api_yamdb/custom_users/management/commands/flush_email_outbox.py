@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from custom_users.outbox import flush_outbox
+
+
+class Command(BaseCommand):
+    help = "Отправляет все готовые письма из очереди."
+
+    def handle(self, *args, **options):
+        sent = flush_outbox()
+        self.stdout.write(self.style.SUCCESS(f"Отправлено писем: {sent}"))
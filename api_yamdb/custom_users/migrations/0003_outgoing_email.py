@@ -0,0 +1,78 @@
+# Generated by Django 3.2 on 2026-10-18 17:11
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("custom_users", "0002_claimsuser"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="OutgoingEmail",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "subject",
+                    models.CharField(max_length=255, verbose_name="Тема"),
+                ),
+                ("body", models.TextField(verbose_name="Текст")),
+                (
+                    "from_email",
+                    models.EmailField(
+                        max_length=254, verbose_name="Отправитель"
+                    ),
+                ),
+                (
+                    "recipient",
+                    models.EmailField(
+                        max_length=254, verbose_name="Получатель"
+                    ),
+                ),
+                (
+                    "attempts",
+                    models.PositiveSmallIntegerField(
+                        default=0, verbose_name="Попытки отправки"
+                    ),
+                ),
+                (
+                    "send_after",
+                    models.DateTimeField(
+                        db_index=True,
+                        default=django.utils.timezone.now,
+                        verbose_name="Не раньше",
+                    ),
+                ),
+                (
+                    "claim",
+                    models.UUIDField(
+                        editable=False,
+                        null=True,
+                        verbose_name="Метка отправителя",
+                    ),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(
+                        auto_now_add=True, verbose_name="Дата постановки"
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Письмо",
+                "verbose_name_plural": "Очередь писем",
+                "ordering": ("send_after", "id"),
+            },
+        ),
+    ]
@@ -1,9 +1,19 @@
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import AbstractUser
+from django.core.mail import EmailMessage
 from django.core.validators import RegexValidator
-from django.db import models
+from django.db import DEFAULT_DB_ALIAS, DatabaseError, models
+from django.db.models import DEFERRED
+from django.utils import timezone
+from rest_framework.exceptions import AuthenticationFailed
 
-from custom_users.constants import MAX_LENGTH_EMAIL, MAX_LENGTH_NAME
+from custom_users.cache import user_rows
+from custom_users.constants import (
+    MAX_LENGTH_EMAIL,
+    MAX_LENGTH_NAME,
+    MESSAGE_USER_NOT_FOUND,
+    TOKEN_CLAIMS,
+)
 
 
 class CustomUser(AbstractUser):
@@ -41,4 +51,120 @@ class CustomUser(AbstractUser):
         return self.role == self.MODERATOR
 
 
+class ClaimsUser(CustomUser):
+    """
+    Пользователь, восстановленный из утверждений access-токена без запроса
+    к БД. Остальные поля догружаются разом из кэша строк пользователей.
+    """
+
+    class Meta:
+        proxy = True
+
+    @classmethod
+    def from_claims(cls, user_id, token):
+        claims = {"id": user_id}
+        claims.update((name, token[name]) for name in TOKEN_CLAIMS)
+        values = [
+            claims.get(field.attname, DEFERRED)
+            for field in cls._meta.concrete_fields
+        ]
+        user = cls.from_db(DEFAULT_DB_ALIAS, list(claims), values)
+        user._claims = claims
+        return user
+
+    def refresh_from_db(self, using=None, fields=None):
+        """
+        Токен не сверяется с БД при входе, поэтому удалённый пользователь
+        обнаруживается здесь и получает 401.
+        """
+        deferred = self.get_deferred_fields()
+        if fields is None or not deferred.issuperset(fields):
+            return super().refresh_from_db(using, fields)
+        row = get_user_row(self.pk)
+        if row is None:
+            raise AuthenticationFailed(
+                MESSAGE_USER_NOT_FOUND, code="user_not_found"
+            )
+        for name in deferred:
+            setattr(self, name, row[name])
+
+    def save(self, *args, update_fields=None, **kwargs):
+        """
+        Не перезаписывает роль и флаги из токена, если они не менялись:
+        в БД они могли измениться после выдачи токена.
+        """
+        if update_fields is None and not self._state.adding:
+            deferred = self.get_deferred_fields()
+            update_fields = [
+                field.attname
+                for field in self._meta.concrete_fields
+                if not field.primary_key
+                and field.attname not in deferred
+                and (
+                    field.attname not in self._claims
+                    or getattr(self, field.attname)
+                    != self._claims[field.attname]
+                )
+            ]
+        try:
+            super().save(*args, update_fields=update_fields, **kwargs)
+        except DatabaseError:
+            # UPDATE не затронул строк: пользователя удалили после выдачи
+            # токена.
+            if update_fields is None or CustomUser.objects.filter(
+                pk=self.pk
+            ).exists():
+                raise
+            raise AuthenticationFailed(
+                MESSAGE_USER_NOT_FOUND, code="user_not_found"
+            )
+
+
+def get_user_row(pk):
+    """Возвращает значения полей пользователя из кэша процесса или из БД."""
+    row = user_rows.get(pk)
+    if row is None:
+        fields = [field.attname for field in CustomUser._meta.concrete_fields]
+        row = CustomUser.objects.filter(pk=pk).values(*fields).first()
+        if row is not None:
+            user_rows.set(pk, row)
+    return row
+
+
+def get_cached_user(pk):
+    """Возвращает пользователя по строке из кэша процесса или None."""
+    row = get_user_row(pk)
+    if row is None:
+        return None
+    return CustomUser.from_db(DEFAULT_DB_ALIAS, list(row), list(row.values()))
+
+
+class OutgoingEmail(models.Model):
+    """Письмо, ждущее фоновой отправки."""
+
+    subject = models.CharField("Тема", max_length=255)
+    body = models.TextField("Текст")
+    from_email = models.EmailField("Отправитель", max_length=MAX_LENGTH_EMAIL)
+    recipient = models.EmailField("Получатель", max_length=MAX_LENGTH_EMAIL)
+    attempts = models.PositiveSmallIntegerField("Попытки отправки", default=0)
+    send_after = models.DateTimeField(
+        "Не раньше", default=timezone.now, db_index=True
+    )
+    claim = models.UUIDField("Метка отправителя", null=True, editable=False)
+    created_at = models.DateTimeField("Дата постановки", auto_now_add=True)
+
+    class Meta:
+        ordering = ("send_after", "id")
+        verbose_name = "Письмо"
+        verbose_name_plural = "Очередь писем"
+
+    def __str__(self):
+        return f"{self.recipient}: {self.subject}"
+
+    def message(self):
+        return EmailMessage(
+            self.subject, self.body, self.from_email, [self.recipient]
+        )
+
+
 User = get_user_model()
@@ -0,0 +1,125 @@
+import logging
+import threading
+import time
+import uuid
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.mail import get_connection
+from django.db import connection, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from custom_users.models import OutgoingEmail
+
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE = 100
+
+
+def enqueue_email(subject, body, from_email, recipients):
+    """
+    Ставит письмо в очередь и будит фоновый поток после фиксации транзакции.
+    Синхронная отправка очереди (EMAIL_OUTBOX_SYNC) предназначена для тестов.
+    """
+    OutgoingEmail.objects.bulk_create(
+        OutgoingEmail(
+            subject=subject,
+            body=body,
+            from_email=from_email,
+            recipient=recipient,
+        )
+        for recipient in recipients
+    )
+    if settings.EMAIL_OUTBOX_SYNC:
+        transaction.on_commit(flush_outbox)
+    else:
+        transaction.on_commit(worker.wake)
+
+
+def claim_batch(batch_size=BATCH_SIZE):
+    """
+    Забирает пачку готовых к отправке писем. Повторная попытка для них
+    откладывается заранее, так что другой отправитель их не возьмёт.
+    """
+    now = timezone.now()
+    claim = uuid.uuid4()
+    pending = OutgoingEmail.objects.filter(
+        send_after__lte=now, attempts__lt=settings.EMAIL_OUTBOX_MAX_ATTEMPTS
+    )
+    with transaction.atomic():
+        pks = list(pending.values_list("pk", flat=True)[:batch_size])
+        pending.filter(pk__in=pks).update(
+            claim=claim,
+            attempts=F("attempts") + 1,
+            send_after=now
+            + timedelta(seconds=settings.EMAIL_OUTBOX_RETRY_DELAY),
+        )
+    return list(OutgoingEmail.objects.filter(claim=claim))
+
+
+def send_batch(emails):
+    """Отправляет письма через одно соединение, удаляя доставленные."""
+    if not emails:
+        return 0
+    sent = []
+    try:
+        with get_connection() as backend:
+            for email in emails:
+                try:
+                    backend.send_messages([email.message()])
+                except Exception:
+                    logger.exception("Не удалось отправить письмо %s.", email)
+                else:
+                    sent.append(email.pk)
+    except Exception:
+        logger.exception("Не удалось открыть соединение с почтой.")
+    OutgoingEmail.objects.filter(pk__in=sent).delete()
+    return len(sent)
+
+
+def flush_outbox(batch_size=BATCH_SIZE):
+    """Синхронно отправляет все готовые письма пачками."""
+    total = 0
+    while True:
+        emails = claim_batch(batch_size)
+        if not emails:
+            return total
+        total += send_batch(emails)
+
+
+class OutboxWorker:
+    """
+    Фоновый поток, отправляющий письма пачками с задержкой и периодически
+    повторяющий неудачные попытки.
+    """
+
+    def __init__(self):
+        self._wakeup = threading.Event()
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def wake(self):
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self.run, name="email-outbox", daemon=True
+                )
+                self._thread.start()
+        self._wakeup.set()
+
+    def run(self):
+        while True:
+            self._wakeup.wait(settings.EMAIL_OUTBOX_RETRY_DELAY)
+            # Задержка копит письма, чтобы отправить их одним соединением.
+            time.sleep(settings.EMAIL_OUTBOX_DELAY)
+            self._wakeup.clear()
+            try:
+                flush_outbox()
+            except Exception:
+                logger.exception("Не удалось отправить письма из очереди.")
+            finally:
+                connection.close()
+
+
+worker = OutboxWorker()
@@ -1,9 +1,15 @@
 from django.core.validators import MaxLengthValidator
 from django.contrib.auth.validators import UnicodeUsernameValidator
-from django.db import IntegrityError
+from django.db import IntegrityError, transaction
+from django.utils.crypto import get_random_string
 from rest_framework import serializers
+from rest_framework.settings import api_settings
 
-from custom_users.constants import MAX_LENGTH_EMAIL, MAX_LENGTH_NAME
+from custom_users.constants import (
+    CONFIRMATION_CODE_LENGTH,
+    MAX_LENGTH_EMAIL,
+    MAX_LENGTH_NAME,
+)
 from custom_users.models import CustomUser
 from custom_users.validators import validate_username
 
@@ -81,13 +87,27 @@ class AuthSerializer(serializers.Serializer):
         validators=(validate_username, UnicodeUsernameValidator()),
     )
 
-    def validate(self, data):
-        try:
-            CustomUser.objects.get_or_create(
-                username=data.get("username"), email=data.get("email")
-            )
-        except IntegrityError:
-            raise serializers.ValidationError(
-                "Одно из полей username или email уже занято"
-            )
-        return data
+    def create(self, validated_data):
+        """
+        Выдаёт новый код подтверждения, создавая пользователя при первой
+        регистрации: не больше двух запросов к таблице пользователей.
+        """
+        code = get_random_string(CONFIRMATION_CODE_LENGTH)
+        users = CustomUser.objects.filter(**validated_data)
+        if not users.update(confirmation_code=code):
+            try:
+                with transaction.atomic():
+                    return CustomUser.objects.create(
+                        confirmation_code=code, **validated_data
+                    )
+            except IntegrityError:
+                # Пользователя мог создать параллельный запрос.
+                if not users.update(confirmation_code=code):
+                    raise serializers.ValidationError(
+                        {
+                            api_settings.NON_FIELD_ERRORS_KEY: [
+                                "Одно из полей username или email уже занято"
+                            ]
+                        }
+                    )
+        return CustomUser(confirmation_code=code, **validated_data)
@@ -0,0 +1,14 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from custom_users.cache import user_rows
+from custom_users.models import ClaimsUser, CustomUser
+
+
+@receiver(post_save, sender=CustomUser)
+@receiver(post_save, sender=ClaimsUser)
+@receiver(post_delete, sender=CustomUser)
+@receiver(post_delete, sender=ClaimsUser)
+def forget_user_row(sender, instance, **kwargs):
+    """Сбрасывает строку пользователя в кэше процесса после изменения."""
+    user_rows.delete(instance.pk)
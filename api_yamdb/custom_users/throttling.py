@@ -0,0 +1,68 @@
+from hashlib import md5
+
+from rest_framework.settings import api_settings
+from rest_framework.throttling import SimpleRateThrottle
+
+
+class TokenBucketThrottle(SimpleRateThrottle):
+    """
+    Корзина токенов: ставка scope, например "10/min", задаёт ёмкость и
+    скорость пополнения. Запрос тратит по токену из корзины адреса клиента
+    и корзин каждого переданного идентификатора, к БД не обращается.
+    """
+
+    identity_fields = ()
+
+    def get_rate(self):
+        return api_settings.DEFAULT_THROTTLE_RATES.get(self.scope)
+
+    def get_cache_keys(self, request):
+        idents = [f"ip:{self.get_ident(request)}"]
+        data = request.data if isinstance(request.data, dict) else {}
+        for field in self.identity_fields:
+            value = data.get(field)
+            if isinstance(value, str) and value:
+                digest = md5(value.lower().encode()).hexdigest()
+                idents.append(f"{field}:{digest}")
+        return [
+            self.cache_format % {"scope": self.scope, "ident": ident}
+            for ident in idents
+        ]
+
+    def allow_request(self, request, view):
+        if self.rate is None:
+            return True
+        now = self.timer()
+        refill_rate = self.num_requests / self.duration
+        keys = self.get_cache_keys(request)
+        buckets = self.cache.get_many(keys)
+        self.wait_time = 0
+        updated = {}
+        for key in keys:
+            tokens, updated_at = buckets.get(key, (self.num_requests, now))
+            tokens = min(
+                self.num_requests, tokens + (now - updated_at) * refill_rate
+            )
+            if tokens < 1:
+                self.wait_time = max(
+                    self.wait_time, (1 - tokens) / refill_rate
+                )
+            updated[key] = (tokens - 1, now)
+        if self.wait_time:
+            return False
+        # Пустая корзина без запросов наполняется за duration секунд.
+        self.cache.set_many(updated, self.duration)
+        return True
+
+    def wait(self):
+        return self.wait_time
+
+
+class SignUpThrottle(TokenBucketThrottle):
+    scope = "signup"
+    identity_fields = ("username", "email")
+
+
+class TokenThrottle(TokenBucketThrottle):
+    scope = "token"
+    identity_fields = ("username",)
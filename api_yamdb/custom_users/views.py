@@ -1,14 +1,15 @@
-from django.core.mail import send_mail
+from django.db import transaction
 from django.shortcuts import get_object_or_404
-from django.contrib.auth.tokens import default_token_generator
-from rest_framework import filters, status, views, viewsets
-from rest_framework.decorators import action, api_view
+from rest_framework import status, views, viewsets
+from rest_framework.decorators import action, api_view, throttle_classes
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.pagination import PageNumberPagination
-from rest_framework_simplejwt.tokens import RefreshToken
 
+from custom_users.authentication import ClaimsAccessToken
+from custom_users.filters import PrefixSearchFilter
 from custom_users.models import User
+from custom_users.outbox import enqueue_email
 from custom_users.permissions import IsAdmin
 from custom_users.serializers import (
     AuthSerializer,
@@ -16,7 +17,9 @@ from custom_users.serializers import (
     UserAdminSerializer,
     UserSerializer,
 )
-from api_yamdb.settings import ADMIN_EMAIL
+from custom_users.throttling import SignUpThrottle, TokenThrottle
+from reviews.signals import deferred_counters
+from api_yamdb.settings import ADMIN_EMAIL, USERNAME_AUTOCOMPLETE_LIMIT
 
 
 class UserViewSet(viewsets.ModelViewSet):
@@ -25,10 +28,15 @@ class UserViewSet(viewsets.ModelViewSet):
     permission_classes = (IsAdmin, AllowAny)
     pagination_class = PageNumberPagination
     lookup_field = "username"
-    filter_backends = (filters.SearchFilter,)
+    filter_backends = (PrefixSearchFilter,)
     search_fields = ("username",)
     http_method_names = ["get", "post", "patch", "delete"]
 
+    def perform_destroy(self, instance):
+        """Каскад отзывов и комментариев пересчитывает счётчики один раз."""
+        with transaction.atomic(), deferred_counters():
+            instance.delete()
+
     @action(
         detail=False,
         methods=["get", "patch"],
@@ -47,39 +55,48 @@ class UserViewSet(viewsets.ModelViewSet):
         serializer.save()
         return Response(serializer.data, status=status.HTTP_200_OK)
 
+    @action(
+        detail=False, pagination_class=None, search_fields=("^username",)
+    )
+    def autocomplete(self, request):
+        """Имена пользователей, начинающиеся с ?search=, по индексу."""
+        usernames = (
+            self.filter_queryset(self.get_queryset())
+            .order_by("username")
+            .values_list("username", flat=True)
+        )
+        return Response(
+            list(usernames[:USERNAME_AUTOCOMPLETE_LIMIT]),
+            status=status.HTTP_200_OK,
+        )
+
 
 @action(detail=False, permission_classes=[AllowAny])
 @api_view(["POST"])
+@throttle_classes([TokenThrottle])
 def token(request):
     serializer = GetTokenSerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
     user = get_object_or_404(User, username=serializer.data["username"])
     if serializer.data["confirmation_code"] == user.confirmation_code:
-        refresh = RefreshToken.for_user(user)
-        return Response(
-            {"token": str(refresh.access_token)}, status=status.HTTP_200_OK
-        )
+        access = ClaimsAccessToken.for_user(user)
+        return Response({"token": str(access)}, status=status.HTTP_200_OK)
     return Response(status=status.HTTP_400_BAD_REQUEST)
 
 
 class SignUpView(views.APIView):
     permission_classes = (AllowAny,)
+    throttle_classes = (SignUpThrottle,)
 
     def post(self, request):
         serializer = AuthSerializer(data=request.data)
         if serializer.is_valid():
-            user = User.objects.get(
-                username=request.data.get("username"),
-                email=request.data.get("email"),
-            )
-            confirmation_code = default_token_generator.make_token(user)
-            send_mail(
+            user = serializer.save()
+            enqueue_email(
                 "Код подтверждения",
-                f"Ваш код - {confirmation_code}",
+                f"Ваш код - {user.confirmation_code}",
                 ADMIN_EMAIL,
-                [request.data.get("email")],
+                [user.email],
             )
-            user.confirmation_code = confirmation_code
-            user.save()
             return Response(serializer.data, status=status.HTTP_200_OK)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
@@ -1,6 +1,17 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_migrate
 
 
 class ReviewsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "reviews"
+
+    def ready(self):
+        import reviews.signals  # noqa: F401
+        from reviews.fts import ensure_title_fts
+        from reviews.rating_queue import queue_enabled, worker
+
+        post_migrate.connect(ensure_title_fts, sender=self)
+        if queue_enabled():
+            # Очередь могла остаться непустой после перезапуска.
+            worker.wake()
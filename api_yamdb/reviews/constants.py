@@ -2,3 +2,6 @@ MAX_NAME_LENGTH = 256
 MAX_SLUG_LENGTH = 50
 REVIEW_TEXT_CUT = 20
 COMMENT_TEXT_CUT = 20
+MIN_SCORE = 1
+MAX_SCORE = 10
+TITLE_FTS_TABLE = "reviews_title_fts"
@@ -0,0 +1,49 @@
+from django.db import connections
+
+from reviews.constants import TITLE_FTS_TABLE
+
+TRIGGERS_SQL = (
+    f"CREATE TRIGGER IF NOT EXISTS {TITLE_FTS_TABLE}_ai "
+    "AFTER INSERT ON reviews_title BEGIN "
+    f"INSERT INTO {TITLE_FTS_TABLE}(rowid, name, description) "
+    "VALUES (new.id, new.name, new.description); END",
+    f"CREATE TRIGGER IF NOT EXISTS {TITLE_FTS_TABLE}_ad "
+    "AFTER DELETE ON reviews_title BEGIN "
+    f"INSERT INTO {TITLE_FTS_TABLE}"
+    f"({TITLE_FTS_TABLE}, rowid, name, description) "
+    "VALUES ('delete', old.id, old.name, old.description); END",
+    f"CREATE TRIGGER IF NOT EXISTS {TITLE_FTS_TABLE}_au "
+    "AFTER UPDATE OF name, description ON reviews_title BEGIN "
+    f"INSERT INTO {TITLE_FTS_TABLE}"
+    f"({TITLE_FTS_TABLE}, rowid, name, description) "
+    "VALUES ('delete', old.id, old.name, old.description); "
+    f"INSERT INTO {TITLE_FTS_TABLE}(rowid, name, description) "
+    "VALUES (new.id, new.name, new.description); END",
+)
+
+
+def ensure_title_fts(sender, using="default", **kwargs):
+    """
+    Восстанавливает триггеры FTS5 после миграций. SQLite пересоздаёт
+    reviews_title при изменении схемы, и триггеры удаляются вместе с ней.
+    """
+    connection = connections[using]
+    if connection.vendor != "sqlite":
+        return
+    tables = connection.introspection.table_names()
+    if TITLE_FTS_TABLE not in tables or "reviews_title" not in tables:
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT COUNT(*) FROM sqlite_master "
+            "WHERE type = 'trigger' AND name LIKE %s",
+            (f"{TITLE_FTS_TABLE}_%",),
+        )
+        if cursor.fetchone()[0] == len(TRIGGERS_SQL):
+            return
+        for statement in TRIGGERS_SQL:
+            cursor.execute(statement)
+        cursor.execute(
+            f"INSERT INTO {TITLE_FTS_TABLE}({TITLE_FTS_TABLE}) "
+            "VALUES ('rebuild')"
+        )
@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+
+from reviews.rating_queue import flush_rating_queue
+
+
+class Command(BaseCommand):
+    help = "Пересчитывает рейтинг всех произведений из очереди."
+
+    def handle(self, *args, **options):
+        processed = flush_rating_queue()
+        self.stdout.write(
+            self.style.SUCCESS(f"Пересчитан рейтинг произведений: {processed}")
+        )
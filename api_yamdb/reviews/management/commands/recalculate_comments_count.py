@@ -0,0 +1,24 @@
+from django.core.management.base import BaseCommand
+
+from reviews.models import Review
+
+
+class Command(BaseCommand):
+    help = "Пересчитывает хранимое число комментариев к отзывам."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "reviews",
+            nargs="*",
+            type=int,
+            help="id отзывов; по умолчанию пересчитываются все.",
+        )
+
+    def handle(self, *args, **options):
+        reviews = Review.objects.all()
+        if options["reviews"]:
+            reviews = reviews.filter(pk__in=options["reviews"])
+        updated = reviews.recalculate_comments_count()
+        self.stdout.write(
+            self.style.SUCCESS(f"Пересчитано отзывов: {updated}")
+        )
@@ -0,0 +1,24 @@
+from django.core.management.base import BaseCommand
+
+from reviews.models import Title
+
+
+class Command(BaseCommand):
+    help = "Пересчитывает хранимый рейтинг произведений по отзывам."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "titles",
+            nargs="*",
+            type=int,
+            help="id произведений; по умолчанию пересчитываются все.",
+        )
+
+    def handle(self, *args, **options):
+        titles = Title.objects.all()
+        if options["titles"]:
+            titles = titles.filter(pk__in=options["titles"])
+        updated = titles.recalculate_ratings()
+        self.stdout.write(
+            self.style.SUCCESS(f"Пересчитан рейтинг произведений: {updated}")
+        )
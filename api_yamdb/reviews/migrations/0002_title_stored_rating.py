@@ -0,0 +1,63 @@
+# Generated by Django 3.2 on 2026-10-18 16:39
+
+from django.db import migrations, models
+from django.db.models.functions import Coalesce
+
+
+def recalculate_ratings(apps, schema_editor):
+    Title = apps.get_model("reviews", "Title")
+    Review = apps.get_model("reviews", "Review")
+    reviews = Review.objects.filter(title=models.OuterRef("pk")).order_by()
+    reviews = reviews.values("title")
+    Title.objects.update(
+        score_sum=Coalesce(
+            models.Subquery(
+                reviews.annotate(total=models.Sum("score")).values("total"),
+                output_field=models.IntegerField(),
+            ),
+            models.Value(0),
+        ),
+        reviews_count=Coalesce(
+            models.Subquery(
+                reviews.annotate(total=models.Count("pk")).values("total"),
+                output_field=models.IntegerField(),
+            ),
+            models.Value(0),
+        ),
+        rating=models.Subquery(
+            reviews.annotate(average=models.Avg("score")).values("average"),
+            output_field=models.FloatField(),
+        ),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("reviews", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="title",
+            name="rating",
+            field=models.FloatField(
+                blank=True, editable=False, null=True, verbose_name="Рейтинг"
+            ),
+        ),
+        migrations.AddField(
+            model_name="title",
+            name="reviews_count",
+            field=models.PositiveIntegerField(
+                default=0, editable=False, verbose_name="Количество отзывов"
+            ),
+        ),
+        migrations.AddField(
+            model_name="title",
+            name="score_sum",
+            field=models.PositiveIntegerField(
+                default=0, editable=False, verbose_name="Сумма оценок"
+            ),
+        ),
+        migrations.RunPython(recalculate_ratings, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 3.2 on 2026-10-18 16:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("reviews", "0002_title_stored_rating"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="title",
+            index=models.Index(
+                fields=["name", "id"], name="title_name_id_idx"
+            ),
+        ),
+    ]
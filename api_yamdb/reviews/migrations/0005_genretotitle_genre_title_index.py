@@ -0,0 +1,20 @@
+# Generated by Django 3.2 on 2026-10-18 17:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("reviews", "0004_title_fts"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="genretotitle",
+            index=models.Index(
+                fields=["genre", "title"],
+                name="genretotitle_genre_title_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 3.2 on 2026-10-18 18:05
+
+from django.db import migrations, models
+from django.db.models.functions import Coalesce
+
+
+def recalculate_comments_count(apps, schema_editor):
+    Review = apps.get_model("reviews", "Review")
+    Comment = apps.get_model("reviews", "Comment")
+    Review.objects.update(
+        comments_count=Coalesce(
+            models.Subquery(
+                Comment.objects.filter(review=models.OuterRef("pk"))
+                .order_by()
+                .values("review")
+                .annotate(total=models.Count("pk"))
+                .values("total"),
+                output_field=models.IntegerField(),
+            ),
+            models.Value(0),
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("reviews", "0005_genretotitle_genre_title_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="review",
+            name="comments_count",
+            field=models.PositiveIntegerField(
+                default=0,
+                editable=False,
+                verbose_name="Количество комментариев",
+            ),
+        ),
+        migrations.RunPython(
+            recalculate_comments_count, migrations.RunPython.noop
+        ),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 3.2 on 2026-10-18 19:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("reviews", "0007_review_comment_pub_date_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="RatingQueue",
+            fields=[
+                (
+                    "title_id",
+                    models.BigIntegerField(
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="id произведения",
+                    ),
+                ),
+                (
+                    "queued_at",
+                    models.DateTimeField(
+                        auto_now_add=True, verbose_name="Дата постановки"
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Пересчёт рейтинга",
+                "verbose_name_plural": "Очередь пересчёта рейтинга",
+                "ordering": ("queued_at",),
+            },
+        ),
+    ]
@@ -0,0 +1,55 @@
+# Generated by Django 3.2 on 2026-10-18 19:40
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models.functions import Cast
+
+
+def calculate_weighted_rating(apps, schema_editor):
+    Title = apps.get_model("reviews", "Title")
+    weight = settings.RATING_PRIOR_WEIGHT
+    Title.objects.update(
+        weighted_rating=Cast(
+            models.Value(weight * settings.RATING_PRIOR_MEAN)
+            + models.F("score_sum"),
+            models.FloatField(),
+        )
+        / (models.Value(weight) + models.F("reviews_count"))
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("reviews", "0008_rating_queue"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="title",
+            name="weighted_rating",
+            field=models.FloatField(
+                blank=True,
+                editable=False,
+                null=True,
+                verbose_name="Взвешенный рейтинг",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="title",
+            index=models.Index(
+                fields=["weighted_rating", "reviews_count"],
+                name="title_weighted_rating_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="title",
+            index=models.Index(
+                fields=["reviews_count", "weighted_rating"],
+                name="title_reviews_count_idx",
+            ),
+        ),
+        migrations.RunPython(
+            calculate_weighted_rating, migrations.RunPython.noop
+        ),
+    ]
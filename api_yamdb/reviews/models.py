@@ -1,6 +1,25 @@
+import re
+
+from django.conf import settings
 from django.contrib.auth import get_user_model
-from django.db import models
-from django.db.models import CheckConstraint, Q
+from django.db import connection, models, transaction
+from django.db.models import (
+    Avg,
+    Case,
+    CheckConstraint,
+    Count,
+    F,
+    FloatField,
+    IntegerField,
+    OuterRef,
+    Q,
+    Subquery,
+    Sum,
+    Value,
+    When,
+)
+from django.db.models.expressions import RawSQL
+from django.db.models.functions import Cast, Coalesce, Greatest
 from django.utils import timezone
 
 from reviews.constants import (
@@ -8,6 +27,7 @@ from reviews.constants import (
     MAX_SLUG_LENGTH,
     REVIEW_TEXT_CUT,
     COMMENT_TEXT_CUT,
+    TITLE_FTS_TABLE,
 )
 from reviews.validators import validate_score, validate_year
 
@@ -48,7 +68,136 @@ class Genre(models.Model):
         return self.name
 
 
-class Title(models.Model):
+class CounterFieldsMixin:
+    """
+    Модель со счётчиками, которые меняются отдельными UPDATE.
+    Обычное сохранение изменённого объекта их не перезаписывает,
+    а сигналы пересчёта выполняются в одной транзакции с записью.
+    """
+
+    counter_fields = ()
+
+    def save(self, *args, **kwargs):
+        if not self._state.adding and kwargs.get("update_fields") is None:
+            deferred = self.get_deferred_fields()
+            kwargs["update_fields"] = [
+                field.name
+                for field in self._meta.concrete_fields
+                if not field.primary_key
+                and field.attname not in deferred
+                and field.name not in self.counter_fields
+            ]
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+
+
+def weighted_rating(score_sum, reviews_count):
+    """
+    Байесовская оценка для рейтингов лучших: к отзывам произведения
+    добавляются RATING_PRIOR_WEIGHT голосов со средней RATING_PRIOR_MEAN,
+    поэтому один отзыв на 10 баллов не выводит произведение в лидеры.
+    """
+    weight = settings.RATING_PRIOR_WEIGHT
+    return Cast(
+        Value(weight * settings.RATING_PRIOR_MEAN) + score_sum, FloatField()
+    ) / (Value(weight) + reviews_count)
+
+
+class TitleQuerySet(models.QuerySet):
+    """Запросы к произведениям с поддержкой хранимого рейтинга."""
+
+    def shift_rating(self, score_delta, count_delta):
+        """
+        Сдвигает сумму оценок и число отзывов одним UPDATE, не опускаясь
+        ниже нуля: рассогласованные счётчики чинит recalculate_ratings.
+        """
+        new_sum = Greatest(F("score_sum") + score_delta, Value(0))
+        new_count = Greatest(F("reviews_count") + count_delta, Value(0))
+        return self.update(
+            score_sum=new_sum,
+            reviews_count=new_count,
+            weighted_rating=weighted_rating(new_sum, new_count),
+            rating=Case(
+                When(
+                    Q(reviews_count__gt=-count_delta),
+                    then=Cast(new_sum, FloatField()) / new_count,
+                ),
+                default=None,
+                output_field=FloatField(),
+            ),
+        )
+
+    def recalculate_ratings(self):
+        """Пересчитывает хранимый рейтинг по таблице отзывов."""
+        reviews = Review.objects.filter(title=OuterRef("pk")).order_by()
+        score_sum = Coalesce(
+            Subquery(
+                reviews.values("title")
+                .annotate(total=Sum("score"))
+                .values("total"),
+                output_field=IntegerField(),
+            ),
+            Value(0),
+        )
+        reviews_count = Coalesce(
+            Subquery(
+                reviews.values("title")
+                .annotate(total=Count("pk"))
+                .values("total"),
+                output_field=IntegerField(),
+            ),
+            Value(0),
+        )
+        return self.update(
+            score_sum=score_sum,
+            reviews_count=reviews_count,
+            weighted_rating=weighted_rating(score_sum, reviews_count),
+            rating=Subquery(
+                reviews.values("title")
+                .annotate(average=Avg("score"))
+                .values("average"),
+                output_field=FloatField(),
+            ),
+        )
+
+    def search(self, text):
+        """
+        Полнотекстовый поиск по названию и описанию с ранжированием.
+        Каждое слово ищется по префиксу. Без FTS5 используется icontains.
+        """
+        words = re.findall(r"\w+", text)
+        if not words or not fts_available():
+            return self.filter(name__icontains=text)
+        match = " ".join(f'"{word}"*' for word in words)
+        return (
+            self.filter(
+                pk__in=RawSQL(
+                    f"SELECT rowid FROM {TITLE_FTS_TABLE} "
+                    f"WHERE {TITLE_FTS_TABLE} MATCH %s",
+                    (match,),
+                )
+            )
+            .annotate(
+                search_rank=RawSQL(
+                    f"SELECT rank FROM {TITLE_FTS_TABLE} "
+                    f"WHERE {TITLE_FTS_TABLE} MATCH %s "
+                    f"AND rowid = {Title._meta.db_table}.id",
+                    (match,),
+                )
+            )
+            .order_by("search_rank", "name", "id")
+        )
+
+
+def fts_available():
+    """Проверяет, создана ли FTS5-таблица для поиска произведений."""
+    return (
+        connection.vendor == "sqlite"
+        and TITLE_FTS_TABLE in connection.introspection.table_names()
+    )
+
+
+class Title(CounterFieldsMixin, models.Model):
     """Произведения."""
 
     name = models.CharField("Произведение", max_length=MAX_NAME_LENGTH)
@@ -63,6 +212,27 @@ class Title(models.Model):
     genre = models.ManyToManyField(
         Genre, through="GenreToTitle", verbose_name="Жанр"
     )
+    score_sum = models.PositiveIntegerField(
+        "Сумма оценок", default=0, editable=False
+    )
+    reviews_count = models.PositiveIntegerField(
+        "Количество отзывов", default=0, editable=False
+    )
+    rating = models.FloatField(
+        "Рейтинг", null=True, blank=True, editable=False
+    )
+    weighted_rating = models.FloatField(
+        "Взвешенный рейтинг", null=True, blank=True, editable=False
+    )
+
+    objects = TitleQuerySet.as_manager()
+
+    counter_fields = (
+        "score_sum",
+        "reviews_count",
+        "rating",
+        "weighted_rating",
+    )
 
     class Meta:
         constraints = [
@@ -71,6 +241,17 @@ class Title(models.Model):
                 name="check_year",
             ),
         ]
+        indexes = [
+            models.Index(fields=("name", "id"), name="title_name_id_idx"),
+            models.Index(
+                fields=("weighted_rating", "reviews_count"),
+                name="title_weighted_rating_idx",
+            ),
+            models.Index(
+                fields=("reviews_count", "weighted_rating"),
+                name="title_reviews_count_idx",
+            ),
+        ]
         ordering = ("name",)
         default_related_name = "titles"
         verbose_name = "Произведение"
@@ -91,6 +272,11 @@ class GenreToTitle(models.Model):
     )
 
     class Meta:
+        indexes = [
+            models.Index(
+                fields=("genre", "title"), name="genretotitle_genre_title_idx"
+            ),
+        ]
         verbose_name = "Жанр произведения"
         verbose_name_plural = "Жанры произведений"
 
@@ -98,7 +284,36 @@ class GenreToTitle(models.Model):
         return f"{self.title}, {self.genre}"
 
 
-class Review(models.Model):
+class ReviewQuerySet(models.QuerySet):
+    """Запросы к отзывам с поддержкой хранимого числа комментариев."""
+
+    def shift_comments_count(self, delta):
+        """
+        Сдвигает число комментариев, не опускаясь ниже нуля: рассогласованный
+        счётчик чинит recalculate_comments_count, а не падение удаления.
+        """
+        return self.update(
+            comments_count=Greatest(F("comments_count") + delta, Value(0))
+        )
+
+    def recalculate_comments_count(self):
+        """Пересчитывает хранимое число комментариев по их таблице."""
+        return self.update(
+            comments_count=Coalesce(
+                Subquery(
+                    Comment.objects.filter(review=OuterRef("pk"))
+                    .order_by()
+                    .values("review")
+                    .annotate(total=Count("pk"))
+                    .values("total"),
+                    output_field=IntegerField(),
+                ),
+                Value(0),
+            )
+        )
+
+
+class Review(CounterFieldsMixin, models.Model):
     text = models.TextField()
     author = models.ForeignKey(
         User, on_delete=models.CASCADE, related_name="reviews"
@@ -112,11 +327,30 @@ class Review(models.Model):
     pub_date = models.DateTimeField(
         "Дата добавления", auto_now_add=True, db_index=True
     )
+    comments_count = models.PositiveIntegerField(
+        "Количество комментариев", default=0, editable=False
+    )
+
+    objects = ReviewQuerySet.as_manager()
+
+    counter_fields = ("comments_count",)
 
     def __str__(self):
         return self.text[:REVIEW_TEXT_CUT]
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """Запоминает оценку из БД, чтобы пересчитать рейтинг по разнице."""
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_score = instance.__dict__.get("score")
+        return instance
+
     class Meta:
+        indexes = [
+            models.Index(
+                fields=("title", "pub_date"), name="review_title_pub_date_idx"
+            ),
+        ]
         ordering = ("pub_date",)
         unique_together = ("author", "title")
 
@@ -136,5 +370,31 @@ class Comment(models.Model):
     def __str__(self):
         return self.text[:COMMENT_TEXT_CUT]
 
+    def save(self, *args, **kwargs):
+        """Сохраняет комментарий и счётчик отзыва в одной транзакции."""
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+
     class Meta:
+        indexes = [
+            models.Index(
+                fields=("review", "pub_date"),
+                name="comment_review_pub_date_idx",
+            ),
+        ]
         ordering = ("pub_date",)
+
+
+class RatingQueue(models.Model):
+    """Произведения, рейтинг которых ждёт фонового пересчёта."""
+
+    title_id = models.BigIntegerField("id произведения", primary_key=True)
+    queued_at = models.DateTimeField("Дата постановки", auto_now_add=True)
+
+    class Meta:
+        ordering = ("queued_at",)
+        verbose_name = "Пересчёт рейтинга"
+        verbose_name_plural = "Очередь пересчёта рейтинга"
+
+    def __str__(self):
+        return str(self.title_id)
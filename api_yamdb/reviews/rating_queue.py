@@ -0,0 +1,85 @@
+import logging
+import threading
+import time
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.dispatch import Signal
+
+from reviews.models import RatingQueue, Title
+
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE = 500
+
+# Отправляется после фонового пересчёта рейтинга; аргумент title_ids.
+ratings_recalculated = Signal()
+
+
+def queue_enabled():
+    return settings.RATING_RECALC_DELAY is not None
+
+
+def enqueue_rating_recalc(title_id):
+    """
+    Ставит произведение в очередь пересчёта рейтинга. Повторная постановка
+    схлопывается с уже ждущей записью, строка произведения не блокируется.
+    """
+    RatingQueue.objects.bulk_create(
+        [RatingQueue(title_id=title_id)], ignore_conflicts=True
+    )
+    transaction.on_commit(worker.wake)
+
+
+def flush_rating_queue(batch_size=BATCH_SIZE):
+    """Синхронно пересчитывает рейтинг всех произведений из очереди."""
+    total = 0
+    while True:
+        with transaction.atomic():
+            title_ids = list(
+                RatingQueue.objects.values_list("title_id", flat=True)[
+                    :batch_size
+                ]
+            )
+            if not title_ids:
+                return total
+            # Запись удаляется до пересчёта: отзыв, пришедший позже,
+            # снова поставит произведение в очередь.
+            RatingQueue.objects.filter(title_id__in=title_ids).delete()
+            Title.objects.filter(pk__in=title_ids).recalculate_ratings()
+            ratings_recalculated.send(sender=Title, title_ids=title_ids)
+        total += len(title_ids)
+
+
+class RatingQueueWorker:
+    """Фоновый поток, пересчитывающий рейтинг пачками с задержкой."""
+
+    def __init__(self):
+        self._wakeup = threading.Event()
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def wake(self):
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self.run, name="rating-queue", daemon=True
+                )
+                self._thread.start()
+        self._wakeup.set()
+
+    def run(self):
+        while True:
+            self._wakeup.wait()
+            # Задержка копит изменения, чтобы пересчитать их одной пачкой.
+            time.sleep(settings.RATING_RECALC_DELAY)
+            self._wakeup.clear()
+            try:
+                flush_rating_queue()
+            except Exception:
+                logger.exception("Не удалось пересчитать рейтинг.")
+            finally:
+                connection.close()
+
+
+worker = RatingQueueWorker()
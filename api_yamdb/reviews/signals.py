@@ -0,0 +1,91 @@
+from contextlib import contextmanager
+from threading import local
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import Signal, receiver
+
+from reviews.models import Comment, Review, Title
+from reviews.rating_queue import enqueue_rating_recalc, queue_enabled
+
+_deferred = local()
+
+# Отправляется на выходе из deferred_counters; аргументы title_ids и
+# review_ids — произведения и отзывы, счётчики которых пересчитаны.
+counters_recalculated = Signal()
+
+
+@contextmanager
+def deferred_counters():
+    """
+    Вместо пересчёта счётчиков на каждой записи копит id затронутых
+    произведений и отзывов и пересчитывает каждый из них один раз на выходе.
+    """
+    if getattr(_deferred, "titles", None) is not None:
+        yield
+        return
+    _deferred.titles, _deferred.reviews = set(), set()
+    try:
+        yield
+        titles, reviews = _deferred.titles, _deferred.reviews
+    finally:
+        _deferred.titles = _deferred.reviews = None
+    if titles:
+        Title.objects.filter(pk__in=titles).recalculate_ratings()
+    if reviews:
+        Review.objects.filter(pk__in=reviews).recalculate_comments_count()
+    if titles or reviews:
+        counters_recalculated.send(
+            sender=Title, title_ids=titles, review_ids=reviews
+        )
+
+
+def defer(name, pk):
+    """Откладывает пересчёт, если он выполняется внутри deferred_counters."""
+    pending = getattr(_deferred, name, None)
+    if pending is None:
+        return False
+    pending.add(pk)
+    return True
+
+
+@receiver(post_save, sender=Review)
+def update_rating_on_save(sender, instance, created, **kwargs):
+    """Обновляет хранимый рейтинг при создании и изменении отзыва."""
+    titles = Title.objects.filter(pk=instance.title_id)
+    previous = getattr(instance, "_loaded_score", None)
+    if defer("titles", instance.title_id):
+        pass
+    elif queue_enabled():
+        enqueue_rating_recalc(instance.title_id)
+    elif created:
+        titles.shift_rating(instance.score, 1)
+    elif previous is None:
+        titles.recalculate_ratings()
+    elif previous != instance.score:
+        titles.shift_rating(instance.score - previous, 0)
+    instance._loaded_score = instance.score
+
+
+@receiver(post_delete, sender=Review)
+def update_rating_on_delete(sender, instance, **kwargs):
+    """Вычитает оценку удалённого отзыва из рейтинга произведения."""
+    if defer("titles", instance.title_id):
+        return
+    if queue_enabled():
+        enqueue_rating_recalc(instance.title_id)
+    else:
+        Title.objects.filter(pk=instance.title_id).shift_rating(
+            -instance.score, -1
+        )
+
+
+@receiver(post_save, sender=Comment)
+def update_comments_count_on_save(sender, instance, created, **kwargs):
+    if created and not defer("reviews", instance.review_id):
+        Review.objects.filter(pk=instance.review_id).shift_comments_count(1)
+
+
+@receiver(post_delete, sender=Comment)
+def update_comments_count_on_delete(sender, instance, **kwargs):
+    if not defer("reviews", instance.review_id):
+        Review.objects.filter(pk=instance.review_id).shift_comments_count(-1)
@@ -1,10 +1,14 @@
 from django.utils import timezone
 from rest_framework.exceptions import ValidationError
 
+from reviews.constants import MAX_SCORE, MIN_SCORE
+
 
 def validate_score(value):
-    if value < 1 or value > 10:
-        raise ValidationError("Оценка должна быть от 1 до 10.")
+    if value < MIN_SCORE or value > MAX_SCORE:
+        raise ValidationError(
+            f"Оценка должна быть от {MIN_SCORE} до {MAX_SCORE}."
+        )
 
 
 def validate_year(value):
@@ -1,6 +1,8 @@
 import os
 import sys
 
+import pytest
+from django.core.cache import cache
 from django.utils.version import get_version
 
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -30,6 +32,19 @@ if FILENAME not in project_dir_content:
 
 assert get_version() < '4.0.0', 'Пожалуйста, используйте версию Django < 4.0.0'
 
+from custom_users.cache import user_rows  # noqa: E402
+
 pytest_plugins = [
     'tests.fixtures.fixture_user',
 ]
+
+
+@pytest.fixture(autouse=True)
+def send_emails_synchronously(settings):
+    settings.EMAIL_OUTBOX_SYNC = True
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    user_rows.clear()
@@ -0,0 +1,81 @@
+import pytest
+from reviews.models import Comment, Review, Title
+
+from tests.utils import count_queries, create_titles_bulk
+
+
+def create_reviews_bulk(django_user_model, title, count):
+    reviews = []
+    for idx in range(count):
+        author = django_user_model.objects.create_user(
+            username=f'author{title.id}_{idx}',
+            email=f'author{title.id}_{idx}@yamdb.fake',
+        )
+        review = Review.objects.create(
+            author=author, title=title, text='Отзыв', score=5
+        )
+        Comment.objects.create(author=author, review=review, text='Коммент')
+        reviews.append(review)
+    return reviews
+
+
+@pytest.mark.django_db(transaction=True)
+class Test09QueryCount:
+
+    TITLES_URL = '/api/v1/titles/'
+
+    def test_01_title_list_queries_do_not_grow(self, client):
+        create_titles_bulk(2)
+        small_page = count_queries(client, self.TITLES_URL)
+        create_titles_bulk(8)
+        full_page = count_queries(client, self.TITLES_URL)
+        assert small_page == full_page, (
+            f'Проверьте, что количество запросов к БД при GET-запросе к '
+            f'`{self.TITLES_URL}` не зависит от размера страницы: '
+            f'{small_page} запросов для 2 произведений и {full_page} '
+            'для 10.'
+        )
+
+    def test_02_title_detail_queries(self, client):
+        create_titles_bulk(1)
+        title = Title.objects.get()
+        queries = count_queries(client, f'{self.TITLES_URL}{title.id}/')
+        assert queries <= 2, (
+            'Проверьте, что GET-запрос к `/api/v1/titles/{title_id}/` '
+            'загружает категорию и жанры без дополнительных запросов.'
+        )
+
+    def test_03_review_list_queries_do_not_grow(self, client,
+                                                django_user_model):
+        create_titles_bulk(2)
+        small, large = Title.objects.all()
+        create_reviews_bulk(django_user_model, small, 2)
+        create_reviews_bulk(django_user_model, large, 10)
+        counts = [
+            count_queries(client, f'{self.TITLES_URL}{title.id}/reviews/')
+            for title in (small, large)
+        ]
+        assert counts[0] == counts[1], (
+            'Проверьте, что авторы отзывов загружаются в основном запросе: '
+            f'{counts[0]} запросов для 2 отзывов и {counts[1]} для 10.'
+        )
+
+    def test_04_comment_list_queries_do_not_grow(self, client,
+                                                 django_user_model):
+        create_titles_bulk(1)
+        title = Title.objects.get()
+        reviews = create_reviews_bulk(django_user_model, title, 10)
+        for review in reviews[1:]:
+            Comment.objects.create(
+                author=review.author, review=reviews[0], text='Ещё'
+            )
+        url = f'{self.TITLES_URL}{title.id}/reviews/{{}}/comments/'
+        counts = [
+            count_queries(client, url.format(review.id))
+            for review in (reviews[1], reviews[0])
+        ]
+        assert counts[0] == counts[1], (
+            'Проверьте, что авторы комментариев загружаются в основном '
+            f'запросе: {counts[0]} запросов для 1 комментария и '
+            f'{counts[1]} для 10.'
+        )
@@ -0,0 +1,151 @@
+import json
+from base64 import b64encode
+from http import HTTPStatus
+from urllib.parse import urlencode
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from reviews.models import Comment, Review, Title
+
+from tests.utils import create_titles_bulk
+
+
+@pytest.mark.django_db(transaction=True)
+class Test10CursorPagination:
+
+    TITLES_URL = '/api/v1/titles/'
+
+    def collect_pages(self, client, url):
+        names = []
+        while url:
+            response = client.get(url)
+            assert response.status_code == HTTPStatus.OK
+            data = response.json()
+            assert 'count' not in data, (
+                'Проверьте, что в режиме `?pagination=cursor` не выполняется '
+                'подсчёт общего количества произведений.'
+            )
+            names.extend(
+                item.get('name', item['id']) for item in data['results']
+            )
+            url = data['next']
+        return names
+
+    def test_01_cursor_pages_cover_all_titles(self, client):
+        create_titles_bulk(25)
+        names = self.collect_pages(
+            client, f'{self.TITLES_URL}?pagination=cursor'
+        )
+        assert names == sorted(names) and len(set(names)) == 25, (
+            'Проверьте, что keyset-пагинация возвращает все произведения '
+            'по одному разу в порядке `name`.'
+        )
+
+    def test_02_cursor_pages_keep_filters(self, client):
+        create_titles_bulk(25)
+        names = self.collect_pages(
+            client, f'{self.TITLES_URL}?pagination=cursor&name=1'
+        )
+        expected = sorted(
+            f'Произведение {idx}' for idx in range(25) if '1' in str(idx)
+        )
+        assert names == expected, (
+            'Проверьте, что keyset-пагинация сохраняет параметры фильтрации '
+            'между страницами.'
+        )
+
+    def test_03_reviews_and_comments_cursor(self, client, user,
+                                            django_user_model):
+        create_titles_bulk(1)
+        title = Title.objects.get()
+        reviews = [
+            Review.objects.create(
+                author=django_user_model.objects.create_user(
+                    username=f'author{idx}', email=f'author{idx}@yamdb.fake'
+                ),
+                title=title,
+                text='Отзыв',
+                score=5,
+            )
+            for idx in range(15)
+        ]
+        for _ in range(15):
+            Comment.objects.create(
+                author=user, review=reviews[0], text='Коммент'
+            )
+        reviews_url = f'{self.TITLES_URL}{title.id}/reviews/'
+        comments_url = f'{reviews_url}{reviews[0].id}/comments/'
+        for url, model, filters in (
+            (reviews_url, Review, {'title': title}),
+            (comments_url, Comment, {'review': reviews[0]}),
+        ):
+            ids = self.collect_pages(client, f'{url}?pagination=cursor')
+            assert ids == list(
+                model.objects.filter(**filters)
+                .order_by('pub_date', 'id')
+                .values_list('id', flat=True)
+            ), (
+                f'Проверьте, что keyset-пагинация `{url}` возвращает все '
+                'объекты по одному разу в порядке `pub_date`.'
+            )
+
+    def test_04_cursor_keyset_on_equal_names(self, client):
+        create_titles_bulk(25)
+        Title.objects.update(name='Произведение')
+        expected = list(
+            Title.objects.order_by('id').values_list('id', flat=True)
+        )
+        ids, url = [], f'{self.TITLES_URL}?pagination=cursor&fields=id'
+        pages = []
+        while url:
+            with CaptureQueriesContext(connection) as context:
+                response = client.get(url)
+            assert not any(
+                'OFFSET' in query['sql'] for query in context.captured_queries
+            ), (
+                'Проверьте, что keyset-пагинация не использует OFFSET для '
+                'произведений с одинаковым названием.'
+            )
+            data = response.json()
+            pages.append(data)
+            ids.extend(item['id'] for item in data['results'])
+            url = data['next']
+        assert ids == expected, (
+            'Проверьте, что keyset-пагинация обходит произведения '
+            'с одинаковым названием по паре (name, id).'
+        )
+
+        previous = client.get(pages[-1]['previous']).json()
+        assert previous['results'] == pages[-2]['results'], (
+            'Проверьте, что ссылка `previous` возвращает предыдущую страницу.'
+        )
+
+    def test_05_cursor_rejects_search(self, client):
+        response = client.get(
+            self.TITLES_URL, {'pagination': 'cursor', 'search': 'Произведение'}
+        )
+        assert response.status_code == HTTPStatus.BAD_REQUEST, (
+            'Проверьте, что keyset-пагинация не сочетается с `?search=`, '
+            'который упорядочивает по релевантности.'
+        )
+
+    def test_06_crafted_cursors(self, client, admin):
+        create_titles_bulk(1)
+        title = Title.objects.get()
+        Review.objects.create(author=admin, title=title, text='Отзыв', score=5)
+        reviews_url = f'{self.TITLES_URL}{title.id}/reviews/'
+        for url, position in (
+            (self.TITLES_URL, ['a', 'x']),
+            (self.TITLES_URL, ['a', None]),
+            (self.TITLES_URL, ['a', {}]),
+            (reviews_url, ['notadate', 1]),
+        ):
+            cursor = b64encode(
+                urlencode({'p': json.dumps(position)}).encode()
+            ).decode()
+            response = client.get(url, {'cursor': cursor})
+            assert response.status_code == HTTPStatus.NOT_FOUND, (
+                f'Проверьте, что курсор с позицией {position} для `{url}` '
+                'возвращает статус 404.'
+            )
@@ -0,0 +1,56 @@
+import pytest
+from reviews.models import Review, Title
+
+from tests.utils import count_queries, create_titles_bulk
+
+
+@pytest.mark.django_db(transaction=True)
+class Test11TitleCache:
+
+    TITLES_URL = '/api/v1/titles/'
+
+    def check_cache(self, client, user):
+        create_titles_bulk(3)
+        title = Title.objects.first()
+        detail_url = f'{self.TITLES_URL}{title.id}/'
+        for url in (self.TITLES_URL, detail_url):
+            count_queries(client, url)
+            assert count_queries(client, url) == 0, (
+                f'Проверьте, что повторный GET-запрос к `{url}` '
+                'обслуживается из кэша без запросов к БД.'
+            )
+
+        Review.objects.create(author=user, title=title, text='ok', score=8)
+        response = client.get(detail_url)
+        assert response.json()['rating'] == 8, (
+            'Проверьте, что создание отзыва сбрасывает кэш произведений.'
+        )
+
+        title.genre.clear()
+        response = client.get(detail_url)
+        assert response.json()['genre'] == [], (
+            'Проверьте, что изменение жанров произведения сбрасывает кэш.'
+        )
+
+    def test_01_locmem_cache(self, client, user):
+        self.check_cache(client, user)
+
+    def test_02_file_based_cache(self, client, user, settings, tmp_path):
+        settings.CACHES = {
+            'default': {
+                'BACKEND': (
+                    'django.core.cache.backends.filebased.FileBasedCache'
+                ),
+                'LOCATION': str(tmp_path),
+            }
+        }
+        self.check_cache(client, user)
+
+    def test_03_query_string_is_normalized(self, client):
+        create_titles_bulk(3)
+        count_queries(client, f'{self.TITLES_URL}?year=2000&name=1')
+        assert count_queries(
+            client, f'{self.TITLES_URL}?name=1&year=2000'
+        ) == 0, (
+            'Проверьте, что ключ кэша не зависит от порядка параметров.'
+        )
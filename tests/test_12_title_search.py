@@ -0,0 +1,45 @@
+from http import HTTPStatus
+
+import pytest
+from reviews.models import Category, Title
+
+
+@pytest.mark.django_db(transaction=True)
+class Test12TitleSearch:
+
+    TITLES_URL = '/api/v1/titles/'
+
+    def search(self, client, query):
+        response = client.get(self.TITLES_URL, {'search': query})
+        assert response.status_code == HTTPStatus.OK
+        return [title['name'] for title in response.json()['results']]
+
+    def test_01_search_ranks_and_matches_prefix(self, client):
+        category = Category.objects.create(name='Фильм', slug='films')
+        Title.objects.create(
+            name='Крепкий орешек', year=1988, category=category,
+            description='Полицейский против террористов.'
+        )
+        Title.objects.create(
+            name='Терминатор', year=1984, category=category,
+            description='Киборг-убийца. Терминатор вернётся.'
+        )
+        Title.objects.create(
+            name='Чужой', year=1979, category=category,
+            description='Терминатор тут ни при чём.'
+        )
+        assert self.search(client, 'Термин') == ['Терминатор', 'Чужой'], (
+            'Проверьте, что параметр `search` ищет по префиксу слова в '
+            'названии и описании и ранжирует результаты по релевантности.'
+        )
+        assert self.search(client, 'полиц') == ['Крепкий орешек']
+
+        title = Title.objects.get(name='Чужой')
+        title.description = 'Космический ужас.'
+        title.save()
+        assert self.search(client, 'Термин') == ['Терминатор'], (
+            'Проверьте, что поисковый индекс обновляется при изменении '
+            'произведения.'
+        )
+        title.delete()
+        assert self.search(client, 'космич') == []
@@ -0,0 +1,69 @@
+from http import HTTPStatus
+
+import pytest
+from reviews.models import Category, Genre, Title
+
+
+@pytest.mark.django_db(transaction=True)
+class Test13TitleFilters:
+
+    TITLES_URL = '/api/v1/titles/'
+
+    @pytest.fixture
+    def titles(self):
+        films = Category.objects.create(name='Фильм', slug='films')
+        books = Category.objects.create(name='Книги', slug='books')
+        drama = Genre.objects.create(name='Драма', slug='drama')
+        comedy = Genre.objects.create(name='Комедия', slug='comedy')
+        Genre.objects.create(name='Драмеди', slug='dram')
+        for name, category, genres in (
+            ('Драмкомедия', films, (drama, comedy)),
+            ('Драма', films, (drama,)),
+            ('Комедия', books, (comedy,)),
+        ):
+            title = Title.objects.create(
+                name=name, year=2000, category=category
+            )
+            title.genre.set(genres)
+
+    def get_names(self, client, params):
+        response = client.get(self.TITLES_URL, params)
+        assert response.status_code == HTTPStatus.OK
+        data = response.json()
+        names = [title['name'] for title in data['results']]
+        assert data['count'] == len(names)
+        return sorted(names)
+
+    def test_01_genre_filter(self, client, titles):
+        assert self.get_names(client, {'genre': 'dram'}) == [], (
+            'Проверьте, что фильтр `genre` сравнивает слаг жанра точно.'
+        )
+        assert self.get_names(client, {'genre': 'drama,comedy'}) == [
+            'Драма', 'Драмкомедия', 'Комедия'
+        ], (
+            'Проверьте, что фильтр `genre` с несколькими слагами возвращает '
+            'произведения любого из жанров без повторов.'
+        )
+        assert self.get_names(
+            client, {'genre': 'drama,comedy', 'genre_match': 'all'}
+        ) == ['Драмкомедия'], (
+            'Проверьте, что при `genre_match=all` возвращаются произведения '
+            'со всеми указанными жанрами.'
+        )
+        assert self.get_names(
+            client, {'genre': 'drama,unknown', 'genre_match': 'all'}
+        ) == []
+
+    def test_02_category_filter(self, client, titles):
+        assert self.get_names(client, {'category': 'film'}) == []
+        assert self.get_names(client, {'category': 'books,films'}) == [
+            'Драма', 'Драмкомедия', 'Комедия'
+        ], (
+            'Проверьте, что фильтр `category` принимает несколько слагов.'
+        )
+
+    def test_03_invalid_genre_match(self, client, titles):
+        response = client.get(
+            self.TITLES_URL, {'genre': 'drama', 'genre_match': 'some'}
+        )
+        assert response.status_code == HTTPStatus.BAD_REQUEST
@@ -0,0 +1,104 @@
+import time
+from http import HTTPStatus
+
+import pytest
+from api.cache import CATALOGUE_VERSION_KEY, get_version
+
+from tests.utils import count_queries, create_comments
+
+
+@pytest.mark.django_db(transaction=True)
+class Test14ConditionalGet:
+
+    def check_not_modified(self, client, url):
+        response = client.get(url)
+        assert response.status_code == HTTPStatus.OK
+        etag = response['ETag']
+        assert etag and response['Last-Modified'], (
+            f'Проверьте, что ответ на GET-запрос к `{url}` содержит '
+            'заголовки `ETag` и `Last-Modified`.'
+        )
+        assert count_queries(
+            client, url, HTTPStatus.NOT_MODIFIED, HTTP_IF_NONE_MATCH=etag
+        ) == 0, (
+            f'Проверьте, что GET-запрос к `{url}` с актуальным '
+            '`If-None-Match` возвращает ответ со статусом 304 без запросов '
+            'к БД.'
+        )
+        response = client.get(
+            url, HTTP_IF_MODIFIED_SINCE=response['Last-Modified']
+        )
+        assert response.status_code == HTTPStatus.NOT_MODIFIED, (
+            f'Проверьте, что GET-запрос к `{url}` с актуальным '
+            '`If-Modified-Since` возвращает ответ со статусом 304.'
+        )
+        return etag
+
+    def test_01_conditional_get(self, client, admin_client, admin, user,
+                                user_client):
+        comments, reviews, titles = create_comments(
+            admin_client, {admin: admin_client, user: user_client}
+        )
+        title_id, review_id = titles[0]['id'], reviews[0]['id']
+        urls = (
+            f'/api/v1/titles/{title_id}/',
+            f'/api/v1/titles/{title_id}/reviews/',
+            f'/api/v1/titles/{title_id}/reviews/{review_id}/comments/',
+        )
+        etags = [self.check_not_modified(client, url) for url in urls]
+
+        response = user_client.patch(
+            f'{urls[2]}{comments[1]["id"]}/', data={'text': 'edited'}
+        )
+        assert response.status_code == HTTPStatus.OK
+        response = client.get(urls[2], HTTP_IF_NONE_MATCH=etags[2])
+        assert response.status_code == HTTPStatus.OK, (
+            'Проверьте, что изменение комментария меняет `ETag` списка '
+            'комментариев.'
+        )
+
+        response = user_client.patch(
+            f'{urls[1]}{reviews[1]["id"]}/', data={'score': 9}
+        )
+        assert response.status_code == HTTPStatus.OK
+        for url, etag in zip(urls[:2], etags[:2]):
+            response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+            assert response.status_code == HTTPStatus.OK, (
+                f'Проверьте, что изменение отзыва меняет `ETag` `{url}`.'
+            )
+
+    def test_02_versions_expire(self, client, settings, monkeypatch):
+        settings.CACHE_VERSION_TIMEOUT = 60
+        url = '/api/v1/titles/'
+        etag = client.get(url)['ETag']
+        version = get_version(CATALOGUE_VERSION_KEY)
+        later = time.time() + 61
+        monkeypatch.setattr(time, 'time', lambda: later)
+        assert get_version(CATALOGUE_VERSION_KEY) > version
+        response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == HTTPStatus.OK, (
+            'Проверьте, что версии ресурсов в кэше процесса живут не дольше '
+            '`CACHE_VERSION_TIMEOUT` и не отдают устаревший 304 бессрочно.'
+        )
+
+    def test_03_deleted_review_comments(self, client, admin_client, admin,
+                                        user, user_client):
+        _, _, titles = create_comments(
+            admin_client, {admin: admin_client, user: user_client}
+        )
+        title_id = titles[1]['id']
+        review = user_client.post(
+            f'/api/v1/titles/{title_id}/reviews/',
+            data={'text': 'Без комментариев', 'score': 7}
+        ).json()
+        url = f'/api/v1/titles/{title_id}/reviews/{review["id"]}/comments/'
+        etag = client.get(url)['ETag']
+        response = user_client.delete(
+            f'/api/v1/titles/{title_id}/reviews/{review["id"]}/'
+        )
+        assert response.status_code == HTTPStatus.NO_CONTENT
+        response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == HTTPStatus.NOT_FOUND, (
+            'Проверьте, что после удаления отзыва список его комментариев '
+            'не отдаётся со статусом 304 по старому `ETag`.'
+        )
@@ -0,0 +1,75 @@
+from http import HTTPStatus
+
+import pytest
+from reviews.models import GenreToTitle, Title
+
+from tests.utils import count_queries, create_categories, create_genre
+
+
+@pytest.mark.django_db(transaction=True)
+class Test15TitleBulkCreate:
+
+    BULK_URL = '/api/v1/titles/bulk/'
+    TITLES_URL = '/api/v1/titles/'
+
+    def test_01_bulk_create(self, admin_client, client):
+        genres = create_genre(admin_client)
+        categories = create_categories(admin_client)
+        count_queries(client, self.TITLES_URL)
+        data = [
+            {
+                'name': f'Произведение {idx}',
+                'year': 2000 + idx,
+                'genre': [genres[0]['slug'], genres[idx % 2 + 1]['slug']],
+                'category': categories[idx % 2]['slug'],
+            }
+            for idx in range(5)
+        ]
+        response = admin_client.post(self.BULK_URL, data=data, format='json')
+        assert response.status_code == HTTPStatus.CREATED, (
+            f'Проверьте, что POST-запрос администратора к `{self.BULK_URL}` '
+            'с корректными данными возвращает ответ со статусом 201.'
+        )
+        created = response.json()
+        assert [title['name'] for title in created] == [
+            title['name'] for title in data
+        ]
+        for title, expected in zip(created, data):
+            stored = Title.objects.get(pk=title['id'])
+            assert stored.name == expected['name']
+            assert sorted(stored.genre.values_list('slug', flat=True)) == (
+                sorted(expected['genre'])
+            ), (
+                'Проверьте, что массовое создание связывает произведения с '
+                'указанными жанрами.'
+            )
+        assert client.get(self.TITLES_URL).json()['count'] == 5, (
+            'Проверьте, что массовое создание сбрасывает кэш каталога.'
+        )
+
+    def test_02_bulk_create_validates_all_items(self, admin_client,
+                                                user_client):
+        genres = create_genre(admin_client)
+        categories = create_categories(admin_client)
+        valid = {
+            'name': 'Годное',
+            'year': 2000,
+            'genre': [genres[0]['slug']],
+            'category': categories[0]['slug'],
+        }
+        invalid = {**valid, 'genre': ['unknown'], 'year': 3000}
+        response = admin_client.post(
+            self.BULK_URL, data=[valid, invalid], format='json'
+        )
+        assert response.status_code == HTTPStatus.BAD_REQUEST
+        errors = response.json()
+        assert errors[0] == {} and set(errors[1]) == {'genre', 'year'}, (
+            'Проверьте, что ответ содержит ошибки для каждого элемента пачки.'
+        )
+        assert not Title.objects.exists()
+        assert not GenreToTitle.objects.exists()
+
+        response = user_client.post(
+            self.BULK_URL, data=[valid], format='json'
+        )
+        assert response.status_code == HTTPStatus.FORBIDDEN
@@ -0,0 +1,42 @@
+from http import HTTPStatus
+
+import pytest
+from reviews.models import Title
+
+from tests.utils import count_queries, create_titles_bulk
+
+
+@pytest.mark.django_db(transaction=True)
+class Test16TitleSparseFields:
+
+    TITLES_URL = '/api/v1/titles/'
+
+    def test_01_fields_trim_response(self, client):
+        create_titles_bulk(3)
+        response = client.get(self.TITLES_URL, {'fields': 'id,name,rating'})
+        assert response.status_code == HTTPStatus.OK
+        for title in response.json()['results']:
+            assert set(title) == {'id', 'name', 'rating'}, (
+                'Проверьте, что параметр `fields` оставляет в ответе только '
+                'запрошенные поля.'
+            )
+        title = Title.objects.first()
+        response = client.get(
+            f'{self.TITLES_URL}{title.id}/', {'fields': 'year,genre'}
+        )
+        assert set(response.json()) == {'year', 'genre'}
+
+    def test_02_fields_skip_related_queries(self, client):
+        create_titles_bulk(3)
+        full = count_queries(client, self.TITLES_URL)
+        sparse = count_queries(
+            client, f'{self.TITLES_URL}?fields=id,name,year,rating'
+        )
+        assert sparse == full - 1, (
+            'Проверьте, что без поля `genre` жанры не загружаются '
+            'отдельным запросом.'
+        )
+
+    def test_03_unknown_fields(self, client):
+        response = client.get(self.TITLES_URL, {'fields': 'id,secret'})
+        assert response.status_code == HTTPStatus.BAD_REQUEST
@@ -0,0 +1,86 @@
+from http import HTTPStatus
+
+import pytest
+
+from tests.utils import count_queries, create_reviews, create_titles
+
+
+@pytest.mark.django_db(transaction=True)
+class Test17TitleStats:
+
+    STATS_URL_TEMPLATE = '/api/v1/titles/{title_id}/stats/'
+
+    def test_01_stats(self, client, admin_client, admin, user, user_client,
+                      moderator, moderator_client):
+        reviews, titles = create_reviews(
+            admin_client,
+            {
+                admin: admin_client,
+                user: user_client,
+                moderator: moderator_client,
+            }
+        )
+        user_client.patch(
+            f'/api/v1/titles/{titles[0]["id"]}/reviews/{reviews[1]["id"]}/',
+            data={'score': 10}
+        )
+        url = self.STATS_URL_TEMPLATE.format(title_id=titles[0]['id'])
+        response = client.get(url)
+        assert response.status_code == HTTPStatus.OK, (
+            f'Проверьте, что GET-запрос к `{self.STATS_URL_TEMPLATE}` '
+            'возвращает ответ со статусом 200.'
+        )
+        data = response.json()
+        expected_histogram = {str(score): 0 for score in range(1, 11)}
+        expected_histogram.update({'5': 2, '10': 1})
+        assert data == {
+            'histogram': expected_histogram,
+            'mean': 20 / 3,
+            'median': 5,
+            'reviews_count': 3,
+        }, (
+            f'Проверьте, что `{self.STATS_URL_TEMPLATE}` возвращает '
+            'гистограмму оценок, среднее, медиану и число отзывов.'
+        )
+        assert count_queries(client, url) == 0, (
+            'Проверьте, что статистика кэшируется до изменения отзывов.'
+        )
+
+        user_client.delete(
+            f'/api/v1/titles/{titles[0]["id"]}/reviews/{reviews[1]["id"]}/'
+        )
+        data = client.get(url).json()
+        assert (data['median'], data['reviews_count']) == (5, 2)
+
+        data = client.get(
+            self.STATS_URL_TEMPLATE.format(title_id=titles[1]['id'])
+        ).json()
+        assert (data['mean'], data['median'], data['reviews_count']) == (
+            None, None, 0
+        )
+
+    def test_02_stats_not_found(self, client):
+        response = client.get(self.STATS_URL_TEMPLATE.format(title_id=999))
+        assert response.status_code == HTTPStatus.NOT_FOUND
+        response = client.get(self.STATS_URL_TEMPLATE.format(title_id='abc'))
+        assert response.status_code == HTTPStatus.NOT_FOUND, (
+            'Проверьте, что нечисловой id произведения возвращает статус 404.'
+        )
+
+    def test_03_stats_cache_versions(self, client, admin_client):
+        titles, _, _ = create_titles(admin_client)
+        url = self.STATS_URL_TEMPLATE.format(title_id=titles[0]['id'])
+        client.get(url)
+        admin_client.patch(
+            f'/api/v1/titles/{titles[1]["id"]}/', data={'year': 2000}
+        )
+        assert count_queries(client, url) == 0, (
+            'Проверьте, что изменение другого произведения не сбрасывает '
+            'кэш статистики.'
+        )
+        admin_client.delete(f'/api/v1/titles/{titles[0]["id"]}/')
+        response = client.get(url)
+        assert response.status_code == HTTPStatus.NOT_FOUND, (
+            'Проверьте, что статистика удалённого произведения без отзывов '
+            'не отдаётся из кэша.'
+        )
@@ -0,0 +1,62 @@
+from http import HTTPStatus
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from reviews.models import Review
+
+from tests.utils import create_titles, get_claims_client
+
+
+@pytest.mark.django_db(transaction=True)
+class Test18ReviewCreate:
+
+    REVIEWS_URL_TEMPLATE = '/api/v1/titles/{title_id}/reviews/'
+
+    def test_01_review_create_single_insert(self, admin_client, user_client):
+        titles, _, _ = create_titles(admin_client)
+        url = self.REVIEWS_URL_TEMPLATE.format(title_id=titles[0]['id'])
+        data = {'text': 'Отзыв', 'score': 7}
+        with CaptureQueriesContext(connection) as context:
+            response = user_client.post(url, data=data)
+        assert response.status_code == HTTPStatus.CREATED
+        selects = [
+            query['sql'] for query in context.captured_queries
+            if query['sql'].startswith('SELECT')
+            and 'reviews_review' in query['sql']
+        ]
+        assert not selects, (
+            'Проверьте, что при создании отзыва не выполняется проверка '
+            'уникальности отдельным запросом.'
+        )
+
+        response = user_client.post(url, data=data)
+        assert response.status_code == HTTPStatus.BAD_REQUEST, (
+            'Проверьте, что повторный отзыв на произведение возвращает ответ '
+            'со статусом 400.'
+        )
+        assert 'non_field_errors' in response.json()
+        assert Review.objects.count() == 1
+
+        response = user_client.post(
+            self.REVIEWS_URL_TEMPLATE.format(title_id=999), data=data
+        )
+        assert response.status_code == HTTPStatus.NOT_FOUND, (
+            'Проверьте, что отзыв на несуществующее произведение возвращает '
+            'ответ со статусом 404.'
+        )
+        assert Review.objects.count() == 1
+
+    def test_02_review_create_by_deleted_user(self, client, admin_client,
+                                              user):
+        titles, _, _ = create_titles(admin_client)
+        user_client = get_claims_client(client, user)
+        user.delete()
+        response = user_client.post(
+            self.REVIEWS_URL_TEMPLATE.format(title_id=titles[0]['id']),
+            data={'text': 'Отзыв', 'score': 7}
+        )
+        assert response.status_code == HTTPStatus.UNAUTHORIZED, (
+            'Проверьте, что отзыв удалённого пользователя не выдаётся за '
+            'повторный.'
+        )
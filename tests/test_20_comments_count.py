@@ -0,0 +1,130 @@
+from http import HTTPStatus
+
+import pytest
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from reviews.models import Comment, Review, Title
+
+from tests.utils import create_comments, create_titles_bulk
+
+
+@pytest.mark.django_db(transaction=True)
+class Test20CommentsCount:
+
+    REVIEW_DETAIL_URL_TEMPLATE = (
+        '/api/v1/titles/{title_id}/reviews/{review_id}/'
+    )
+
+    def get_count(self, client, url):
+        response = client.get(url)
+        assert response.status_code == HTTPStatus.OK
+        return response.json().get('comments_count')
+
+    def test_01_comments_count(self, client, admin_client, admin, user,
+                               user_client):
+        comments, reviews, titles = create_comments(
+            admin_client, {admin: admin_client, user: user_client}
+        )
+        url = self.REVIEW_DETAIL_URL_TEMPLATE.format(
+            title_id=titles[0]['id'], review_id=reviews[0]['id']
+        )
+        assert self.get_count(client, url) == 2, (
+            'Проверьте, что отзыв содержит поле `comments_count` с числом '
+            'комментариев.'
+        )
+        response = client.get(
+            f'/api/v1/titles/{titles[0]["id"]}/reviews/'
+        )
+        assert response.json()['results'][0]['comments_count'] == 2, (
+            'Проверьте, что создание комментария обновляет '
+            '`comments_count` в списке отзывов.'
+        )
+
+        response = admin_client.patch(url, data={'text': 'Новый текст'})
+        assert response.status_code == HTTPStatus.OK
+        assert response.json()['comments_count'] == 2
+
+        response = user_client.delete(
+            f'{url}comments/{comments[1]["id"]}/'
+        )
+        assert response.status_code == HTTPStatus.NO_CONTENT
+        assert self.get_count(client, url) == 1, (
+            'Проверьте, что удаление комментария уменьшает '
+            '`comments_count`.'
+        )
+
+        Review.objects.update(comments_count=0)
+        call_command('recalculate_comments_count')
+        assert Review.objects.get(pk=reviews[0]['id']).comments_count == 1, (
+            'Проверьте, что команда `recalculate_comments_count` '
+            'восстанавливает число комментариев.'
+        )
+
+    def test_02_delete_with_drifted_count(self, admin, admin_client):
+        comments, reviews, titles = create_comments(
+            admin_client, {admin: admin_client}
+        )
+        review = Review.objects.get(pk=reviews[0]['id'])
+        Comment.objects.bulk_create(
+            [Comment(review=review, author=admin, text='Без счётчика')]
+        )
+        comment = Comment.objects.get(text='Без счётчика')
+        Review.objects.update(comments_count=0)
+        url = self.REVIEW_DETAIL_URL_TEMPLATE.format(
+            title_id=titles[0]['id'], review_id=review.id
+        )
+        response = admin_client.delete(f'{url}comments/{comment.id}/')
+        assert response.status_code == HTTPStatus.NO_CONTENT, (
+            'Проверьте, что рассогласованный счётчик комментариев не мешает '
+            'удалению комментария.'
+        )
+        assert Review.objects.get(pk=review.id).comments_count == 0
+
+    def count_delete_queries(self, client, url):
+        client.get('/api/v1/users/me/')
+        with CaptureQueriesContext(connection) as context:
+            response = client.delete(url)
+        assert response.status_code == HTTPStatus.NO_CONTENT
+        return len(context.captured_queries)
+
+    def test_03_cascade_delete_queries_are_fixed(self, admin, admin_client,
+                                                 django_user_model):
+        create_titles_bulk(6)
+        titles = list(Title.objects.order_by('id'))
+        counts = {}
+        for comments_count, (title, review_title, author_title) in (
+            (1, titles[:3]),
+            (20, titles[3:]),
+        ):
+            author = django_user_model.objects.create_user(
+                username=f'author{comments_count}',
+                email=f'author{comments_count}@yamdb.fake',
+            )
+            for parent in (title, review_title, author_title):
+                review = Review.objects.create(
+                    author=author if parent is author_title else admin,
+                    title=parent, text='Отзыв', score=5
+                )
+                Comment.objects.bulk_create(
+                    Comment(review=review, author=admin, text='Коммент')
+                    for _ in range(comments_count)
+                )
+            review = Review.objects.get(title=review_title)
+            counts[comments_count] = (
+                self.count_delete_queries(
+                    admin_client,
+                    f'/api/v1/titles/{review_title.id}/reviews/{review.id}/',
+                ),
+                self.count_delete_queries(
+                    admin_client, f'/api/v1/titles/{title.id}/'
+                ),
+                self.count_delete_queries(
+                    admin_client, f'/api/v1/users/{author.username}/'
+                ),
+            )
+        assert counts[1] == counts[20], (
+            'Проверьте, что удаление отзыва, произведения и пользователя '
+            'выполняет одинаковое число запросов независимо от числа '
+            'комментариев.'
+        )
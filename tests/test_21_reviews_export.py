@@ -0,0 +1,60 @@
+import json
+from http import HTTPStatus
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+from tests.utils import create_comments
+
+
+@pytest.mark.django_db(transaction=True)
+class Test21ReviewsExport:
+
+    EXPORT_URL_TEMPLATE = '/api/v1/titles/{title_id}/reviews/export/'
+
+    def test_01_export_endpoint(self, client, admin_client, admin, user,
+                                user_client):
+        comments, reviews, titles = create_comments(
+            admin_client, {admin: admin_client, user: user_client}
+        )
+        url = self.EXPORT_URL_TEMPLATE.format(title_id=titles[0]['id'])
+        assert client.get(url).status_code == HTTPStatus.UNAUTHORIZED
+        response = user_client.get(url)
+        assert response.status_code == HTTPStatus.OK
+        assert response.streaming, (
+            f'Проверьте, что `{self.EXPORT_URL_TEMPLATE}` отдаёт ответ '
+            'потоком.'
+        )
+        assert response['Content-Type'] == 'application/x-ndjson'
+        lines = [
+            json.loads(line)
+            for line in b''.join(response.streaming_content).splitlines()
+        ]
+        assert [line['id'] for line in lines] == [
+            review['id'] for review in reviews
+        ]
+        assert [comment['id'] for comment in lines[0]['comments']] == [
+            comment['id'] for comment in comments
+        ], (
+            'Проверьте, что комментарии выгружаются внутри своего отзыва.'
+        )
+        assert lines[1]['comments'] == []
+
+        response = user_client.get(
+            self.EXPORT_URL_TEMPLATE.format(title_id=999)
+        )
+        assert response.status_code == HTTPStatus.NOT_FOUND
+
+    def test_02_export_command(self, admin_client, admin, user,
+                               user_client):
+        _, reviews, _ = create_comments(
+            admin_client, {admin: admin_client, user: user_client}
+        )
+        output = StringIO()
+        call_command('export_reviews', stdout=output)
+        lines = [json.loads(line) for line in output.getvalue().splitlines()]
+        assert [line['id'] for line in lines] == [
+            review['id'] for review in reviews
+        ]
+        assert len(lines[0]['comments']) == 2
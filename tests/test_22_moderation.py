@@ -0,0 +1,101 @@
+from http import HTTPStatus
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from reviews.models import Comment, Review, Title
+
+from tests.utils import create_comments, create_reviews
+
+
+@pytest.mark.django_db(transaction=True)
+class Test22BulkModeration:
+
+    MODERATION_URL = '/api/v1/moderation/delete/'
+
+    def test_01_bulk_delete(self, admin_client, admin, user, user_client,
+                            moderator, moderator_client):
+        comments, reviews, titles = create_comments(
+            admin_client,
+            {
+                admin: admin_client,
+                user: user_client,
+                moderator: moderator_client,
+            }
+        )
+        data = {
+            'reviews': [reviews[0]['id'], reviews[1]['id']],
+            'comments': [comments[0]['id']],
+        }
+        response = user_client.post(
+            self.MODERATION_URL, data=data, format='json'
+        )
+        assert response.status_code == HTTPStatus.FORBIDDEN, (
+            f'Проверьте, что `{self.MODERATION_URL}` недоступен обычному '
+            'пользователю.'
+        )
+
+        with CaptureQueriesContext(connection) as context:
+            response = moderator_client.post(
+                self.MODERATION_URL, data=data, format='json'
+            )
+        assert response.status_code == HTTPStatus.OK, (
+            f'Проверьте, что POST-запрос модератора к `{self.MODERATION_URL}` '
+            'возвращает ответ со статусом 200.'
+        )
+        assert response.json() == {'reviews': 2, 'comments': 3}
+        rating_updates = [
+            query for query in context.captured_queries
+            if query['sql'].startswith('UPDATE "reviews_title"')
+        ]
+        assert len(rating_updates) == 1, (
+            'Проверьте, что рейтинг произведений пересчитывается один раз '
+            'на всю пачку удалений.'
+        )
+        assert list(Review.objects.values_list('id', flat=True)) == [
+            reviews[2]['id']
+        ]
+        assert not Comment.objects.exists()
+        title = Title.objects.get(pk=titles[0]['id'])
+        assert (title.reviews_count, title.rating) == (1, 5)
+
+    def test_02_bulk_delete_validation(self, moderator_client):
+        response = moderator_client.post(
+            self.MODERATION_URL, data={}, format='json'
+        )
+        assert response.status_code == HTTPStatus.BAD_REQUEST
+
+    def test_03_bulk_delete_queries_are_fixed(self, admin_client, admin,
+                                              moderator_client):
+        reviews, titles = create_reviews(admin_client, {admin: admin_client})
+        review = Review.objects.get(pk=reviews[0]['id'])
+        comments = Comment.objects.bulk_create(
+            Comment(review=review, author=admin, text=f'comment {idx}')
+            for idx in range(8)
+        )
+        pks = list(
+            Comment.objects.order_by('id').values_list('id', flat=True)
+        )
+        assert len(pks) == len(comments)
+        counts = []
+        for chunk in (pks[:2], pks[2:]):
+            with CaptureQueriesContext(connection) as context:
+                response = moderator_client.post(
+                    self.MODERATION_URL,
+                    data={'comments': chunk},
+                    format='json'
+                )
+            assert response.status_code == HTTPStatus.OK
+            # Строка модератора кэшируется в процессе после первого запроса.
+            counts.append(len([
+                query for query in context.captured_queries
+                if 'custom_users_customuser' not in query['sql']
+            ]))
+        assert counts[0] == counts[1], (
+            'Проверьте, что число запросов при массовом удалении '
+            'комментариев не зависит от их количества.'
+        )
+        response = admin_client.get(
+            f'/api/v1/titles/{titles[0]["id"]}/reviews/'
+        )
+        assert response.json()['results'][0]['comments_count'] == 0
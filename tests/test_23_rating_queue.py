@@ -0,0 +1,65 @@
+import pytest
+from django.apps import apps
+from django.core.management import call_command
+from reviews.models import RatingQueue, Review, Title
+from reviews.rating_queue import flush_rating_queue, worker
+
+from tests.utils import create_reviews
+
+
+@pytest.mark.django_db(transaction=True)
+class Test23RatingQueue:
+
+    TITLE_DETAIL_URL_TEMPLATE = '/api/v1/titles/{title_id}/'
+
+    @pytest.fixture(autouse=True)
+    def queue_mode(self, settings):
+        settings.RATING_RECALC_DELAY = 3600
+
+    def get_rating(self, client, title_id):
+        return client.get(
+            self.TITLE_DETAIL_URL_TEMPLATE.format(title_id=title_id)
+        ).json()['rating']
+
+    def test_01_reviews_are_queued_and_coalesced(self, client, admin_client,
+                                                 admin, user, user_client):
+        reviews, titles = create_reviews(
+            admin_client, {admin: admin_client, user: user_client}
+        )
+        title_id = titles[0]['id']
+        queued = RatingQueue.objects.values_list('title_id', flat=True)
+        assert list(queued) == [title_id], (
+            'Проверьте, что отзывы ставят произведение в очередь пересчёта '
+            'один раз.'
+        )
+        assert self.get_rating(client, title_id) is None
+
+        assert flush_rating_queue() == 1
+        assert not RatingQueue.objects.exists()
+        assert self.get_rating(client, title_id) == 5, (
+            'Проверьте, что пересчёт очереди обновляет рейтинг и сбрасывает '
+            'кэш каталога.'
+        )
+
+        Review.objects.filter(pk=reviews[0]['id']).get().delete()
+        call_command('flush_rating_queue')
+        title = Title.objects.get(pk=title_id)
+        assert (title.reviews_count, title.rating) == (1, 5)
+
+    def test_02_flush_in_batches(self, admin_client, admin):
+        _, titles = create_reviews(admin_client, {admin: admin_client})
+        RatingQueue.objects.bulk_create(
+            [RatingQueue(title_id=title['id']) for title in titles],
+            ignore_conflicts=True,
+        )
+        assert flush_rating_queue(batch_size=1) == 2
+        assert Title.objects.get(pk=titles[0]['id']).rating == 5
+
+    def test_03_worker_wakes_on_startup(self, monkeypatch):
+        wakes = []
+        monkeypatch.setattr(worker, 'wake', lambda: wakes.append(True))
+        apps.get_app_config('reviews').ready()
+        assert wakes, (
+            'Проверьте, что фоновый пересчёт запускается при старте '
+            'приложения и разбирает оставшуюся очередь.'
+        )
@@ -0,0 +1,60 @@
+from http import HTTPStatus
+
+import pytest
+from reviews.models import Genre, Review, Title
+
+from tests.utils import create_titles_bulk
+
+
+@pytest.mark.django_db(transaction=True)
+class Test24TopTitles:
+
+    TOP_URL = '/api/v1/titles/top/'
+
+    @pytest.fixture
+    def rated_titles(self, django_user_model):
+        create_titles_bulk(3)
+        one_review, popular, unrated = Title.objects.order_by('id')
+        authors = [
+            django_user_model.objects.create_user(
+                username=f'critic{idx}', email=f'critic{idx}@yamdb.fake'
+            )
+            for idx in range(6)
+        ]
+        Review.objects.create(
+            author=authors[0], title=one_review, text='Шедевр', score=10
+        )
+        for author in authors:
+            Review.objects.create(
+                author=author, title=popular, text='Хорошо', score=9
+            )
+        drama = Genre.objects.create(name='Драма', slug='drama')
+        one_review.genre.add(drama)
+        return one_review, popular, unrated
+
+    def get_ids(self, client, params=None):
+        response = client.get(self.TOP_URL, params or {})
+        assert response.status_code == HTTPStatus.OK, (
+            f'Проверьте, что GET-запрос к `{self.TOP_URL}` возвращает ответ '
+            'со статусом 200.'
+        )
+        return [title['id'] for title in response.json()]
+
+    def test_01_top_by_weighted_rating(self, client, rated_titles):
+        one_review, popular, _ = rated_titles
+        assert self.get_ids(client) == [popular.id, one_review.id], (
+            'Проверьте, что произведение с одним отзывом на 10 баллов не '
+            'обгоняет произведение с многими высокими оценками, а '
+            'произведения без отзывов не попадают в список.'
+        )
+        assert self.get_ids(client, {'by': 'reviews', 'limit': 1}) == [
+            popular.id
+        ]
+
+    def test_02_top_filters(self, client, rated_titles):
+        one_review, _, _ = rated_titles
+        assert self.get_ids(client, {'genre': 'drama'}) == [one_review.id], (
+            f'Проверьте, что `{self.TOP_URL}` поддерживает фильтр по жанру.'
+        )
+        response = client.get(self.TOP_URL, {'by': 'name'})
+        assert response.status_code == HTTPStatus.BAD_REQUEST
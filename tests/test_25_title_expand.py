@@ -0,0 +1,98 @@
+from http import HTTPStatus
+
+import pytest
+
+from tests.utils import (
+    count_queries, create_comments, create_reviews, create_single_comment,
+    create_single_review
+)
+
+
+@pytest.mark.django_db(transaction=True)
+class Test25TitleExpand:
+
+    TITLE_DETAIL_URL_TEMPLATE = '/api/v1/titles/{title_id}/'
+
+    def test_01_expand_reviews_and_comments(self, client, admin_client,
+                                            admin, user, user_client,
+                                            settings):
+        comments, reviews, titles = create_comments(
+            admin_client, {admin: admin_client, user: user_client}
+        )
+        url = self.TITLE_DETAIL_URL_TEMPLATE.format(title_id=titles[0]['id'])
+        response = client.get(url, {'expand': 'reviews.comments'})
+        assert response.status_code == HTTPStatus.OK
+        data = response.json()
+        assert [review['id'] for review in data.get('reviews', [])] == [
+            review['id'] for review in reviews
+        ], (
+            'Проверьте, что `?expand=reviews` встраивает отзывы в карточку '
+            'произведения.'
+        )
+        assert [
+            comment['id'] for comment in data['reviews'][0]['comments']
+        ] == [comment['id'] for comment in comments], (
+            'Проверьте, что `?expand=reviews.comments` встраивает '
+            'комментарии в отзывы.'
+        )
+        assert data['reviews'][1]['comments'] == []
+        assert 'comments' not in client.get(
+            url, {'expand': 'reviews'}
+        ).json()['reviews'][0]
+
+        settings.EXPAND_ITEMS_LIMIT = 1
+        response = client.get(url, {'expand': 'reviews.comments', 'x': 1})
+        data = response.json()
+        assert len(data['reviews']) == 1
+        assert len(data['reviews'][0]['comments']) == 1, (
+            'Проверьте, что число встроенных объектов ограничено.'
+        )
+
+        response = user_client.patch(
+            f'{url}reviews/{reviews[0]["id"]}/comments/{comments[1]["id"]}/',
+            data={'text': 'edited'}
+        )
+        assert response.status_code == HTTPStatus.OK
+        settings.EXPAND_ITEMS_LIMIT = 10
+        data = client.get(url, {'expand': 'reviews.comments'}).json()
+        assert data['reviews'][0]['comments'][1]['text'] == 'edited', (
+            'Проверьте, что изменение комментария сбрасывает кэш карточки '
+            'произведения.'
+        )
+
+    def test_02_expand_queries_are_fixed(self, client, admin_client, admin,
+                                         user, user_client, moderator,
+                                         moderator_client):
+        _, titles = create_reviews(admin_client, {admin: admin_client})
+        url = self.TITLE_DETAIL_URL_TEMPLATE + '?expand=reviews.comments'
+        small_count = count_queries(
+            client, url.format(title_id=titles[0]['id'])
+        )
+        authors = {
+            user: user_client,
+            moderator: moderator_client,
+        }
+        for author_client in authors.values():
+            review = create_single_review(
+                author_client, titles[1]['id'], 'text', 7
+            )
+            for text in ('first', 'second'):
+                create_single_comment(
+                    author_client, titles[1]['id'], review.json()['id'], text
+                )
+        large_count = count_queries(
+            client, url.format(title_id=titles[1]['id'])
+        )
+        assert large_count == small_count, (
+            'Проверьте, что число запросов к БД при `?expand` не зависит от '
+            'числа отзывов и комментариев.'
+        )
+
+        response = client.get(
+            self.TITLE_DETAIL_URL_TEMPLATE.format(title_id=titles[0]['id']),
+            {'expand': 'ratings'}
+        )
+        assert response.status_code == HTTPStatus.BAD_REQUEST, (
+            'Проверьте, что неизвестное значение `expand` возвращает '
+            'статус 400.'
+        )
@@ -0,0 +1,76 @@
+from http import HTTPStatus
+
+import pytest
+
+from tests.utils import count_queries, get_claims_client
+
+
+@pytest.mark.django_db(transaction=True)
+class Test26ClaimsAuth:
+
+    def test_01_claims_skip_user_lookup(self, client, admin, user):
+        user_client = get_claims_client(client, user)
+        assert count_queries(
+            user_client, '/api/v1/users/', HTTPStatus.FORBIDDEN
+        ) == 0, (
+            'Проверьте, что проверка прав по токену с утверждениями '
+            'не обращается к БД.'
+        )
+        admin_client = get_claims_client(client, admin)
+        assert count_queries(
+            admin_client, f'/api/v1/users/{user.username}/'
+        ) == 1, (
+            'Проверьте, что для администратора с токеном с утверждениями '
+            'выполняется только запрос к пользователю из URL.'
+        )
+
+    def test_02_rows_cached_for_plain_tokens(self, client, user_client):
+        url = '/api/v1/users/me/'
+        first = count_queries(user_client, url)
+        assert first == 1
+        assert count_queries(user_client, url) == 0, (
+            'Проверьте, что строки пользователей кэшируются в процессе.'
+        )
+        response = user_client.patch(url, data={'bio': 'new bio'})
+        assert response.status_code == HTTPStatus.OK
+        assert user_client.get(url).json()['bio'] == 'new bio', (
+            'Проверьте, что изменение пользователя сбрасывает кэш строк.'
+        )
+
+    def test_03_me_with_claims(self, client, user, django_user_model):
+        user_client = get_claims_client(client, user)
+        response = user_client.get('/api/v1/users/me/')
+        assert response.status_code == HTTPStatus.OK
+        assert response.json()['email'] == user.email, (
+            'Проверьте, что остальные поля пользователя догружаются из БД.'
+        )
+
+        django_user_model.objects.filter(pk=user.pk).update(role='moderator')
+        response = user_client.patch(
+            '/api/v1/users/me/', data={'bio': 'new bio'}
+        )
+        assert response.status_code == HTTPStatus.OK
+        user.refresh_from_db()
+        assert user.bio == 'new bio'
+        assert user.role == 'moderator', (
+            'Проверьте, что сохранение пользователя из токена не '
+            'перезаписывает роль, изменённую в БД.'
+        )
+
+    def test_04_deleted_user(self, user, user_client):
+        user.delete()
+        response = user_client.get('/api/v1/users/me/')
+        assert response.status_code == HTTPStatus.UNAUTHORIZED
+
+    def test_05_deleted_user_with_claims(self, client, user):
+        user_client = get_claims_client(client, user)
+        user.delete()
+        response = user_client.get('/api/v1/users/me/')
+        assert response.status_code == HTTPStatus.UNAUTHORIZED, (
+            'Проверьте, что удалённый пользователь с токеном с утверждениями '
+            'получает статус 401.'
+        )
+        response = user_client.patch(
+            '/api/v1/users/me/', data={'bio': 'new bio'}
+        )
+        assert response.status_code == HTTPStatus.UNAUTHORIZED
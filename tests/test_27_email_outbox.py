@@ -0,0 +1,94 @@
+from http import HTTPStatus
+
+import pytest
+from django.apps import apps
+from django.core import mail
+from django.core.mail.backends.locmem import EmailBackend
+from django.core.management import call_command
+from django.utils import timezone
+
+from custom_users import outbox
+from custom_users.models import OutgoingEmail
+
+
+@pytest.mark.django_db(transaction=True)
+class Test27EmailOutbox:
+
+    URL_SIGNUP = '/api/v1/auth/signup/'
+
+    @pytest.fixture(autouse=True)
+    def queue_mode(self, settings):
+        settings.EMAIL_OUTBOX_SYNC = False
+        settings.EMAIL_OUTBOX_DELAY = 3600
+
+    def test_01_signup_only_enqueues(self, client):
+        outbox_before_count = len(mail.outbox)
+        response = client.post(
+            self.URL_SIGNUP,
+            data={'email': 'valid@yamdb.fake', 'username': 'valid_username'}
+        )
+        assert response.status_code == HTTPStatus.OK
+        assert len(mail.outbox) == outbox_before_count, (
+            'Проверьте, что при фоновой отправке регистрация только ставит '
+            'письмо в очередь.'
+        )
+        email = OutgoingEmail.objects.get()
+        assert email.recipient == 'valid@yamdb.fake'
+
+        call_command('flush_email_outbox')
+        assert len(mail.outbox) == outbox_before_count + 1
+        assert mail.outbox[-1].to == ['valid@yamdb.fake']
+        assert not OutgoingEmail.objects.exists(), (
+            'Проверьте, что отправленные письма удаляются из очереди.'
+        )
+
+    def test_02_failed_emails_are_retried(self, monkeypatch):
+        outbox.enqueue_email('subject', 'body', 'from@yamdb.fake',
+                             ['to@yamdb.fake'])
+
+        def fail(backend, messages):
+            raise ConnectionError
+
+        with monkeypatch.context() as patch:
+            patch.setattr(EmailBackend, 'send_messages', fail)
+            assert outbox.flush_outbox() == 0
+        email = OutgoingEmail.objects.get()
+        assert email.attempts == 1
+        assert outbox.flush_outbox() == 0, (
+            'Проверьте, что повторная попытка откладывается.'
+        )
+
+        OutgoingEmail.objects.update(send_after=timezone.now())
+        assert outbox.flush_outbox() == 1, (
+            'Проверьте, что неудачная отправка повторяется.'
+        )
+        assert not OutgoingEmail.objects.exists()
+
+    def test_03_one_connection_per_batch(self, monkeypatch):
+        outbox.enqueue_email('subject', 'body', 'from@yamdb.fake',
+                             ['a@yamdb.fake', 'b@yamdb.fake', 'c@yamdb.fake'])
+        connections = []
+
+        def get_connection():
+            connections.append(EmailBackend())
+            return connections[-1]
+
+        monkeypatch.setattr(outbox, 'get_connection', get_connection)
+        assert outbox.flush_outbox(batch_size=2) == 3
+        assert len(connections) == 2, (
+            'Проверьте, что письма пачки отправляются через одно соединение.'
+        )
+
+    def test_04_worker_wakes_on_startup(self, monkeypatch, settings):
+        wakes = []
+        monkeypatch.setattr(outbox.worker, 'wake', lambda: wakes.append(True))
+        apps.get_app_config('custom_users').ready()
+        assert wakes, (
+            'Проверьте, что отправка писем запускается при старте '
+            'приложения и разбирает оставшуюся очередь.'
+        )
+        settings.EMAIL_OUTBOX_SYNC = True
+        apps.get_app_config('custom_users').ready()
+        assert len(wakes) == 1, (
+            'Проверьте, что в синхронном режиме фоновый поток не запускается.'
+        )
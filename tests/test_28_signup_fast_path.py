@@ -0,0 +1,59 @@
+from http import HTTPStatus
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+
+@pytest.mark.django_db(transaction=True)
+class Test28SignupFastPath:
+
+    URL_SIGNUP = '/api/v1/auth/signup/'
+
+    @pytest.fixture(autouse=True)
+    def queue_mode(self, settings):
+        settings.EMAIL_OUTBOX_SYNC = False
+        settings.EMAIL_OUTBOX_DELAY = 3600
+
+    def signup(self, client, data, expected_status=HTTPStatus.OK):
+        with CaptureQueriesContext(connection) as context:
+            response = client.post(self.URL_SIGNUP, data=data)
+        assert response.status_code == expected_status
+        user_queries = [
+            query['sql'] for query in context.captured_queries
+            if 'custom_users_customuser' in query['sql']
+        ]
+        return response, user_queries
+
+    def test_01_signup_queries(self, client, django_user_model):
+        data = {'email': 'valid@yamdb.fake', 'username': 'valid_username'}
+        response, queries = self.signup(client, data)
+        assert response.json() == data
+        assert len(queries) == 2, (
+            'Проверьте, что регистрация нового пользователя выполняет не '
+            'больше двух запросов к таблице пользователей.'
+        )
+        first_code = django_user_model.objects.get().confirmation_code
+
+        response, queries = self.signup(client, data)
+        assert response.json() == data
+        assert len(queries) == 1 and queries[0].startswith('UPDATE'), (
+            'Проверьте, что повторная регистрация обновляет код '
+            'подтверждения одним запросом.'
+        )
+        assert 'valid@yamdb.fake' not in queries[0].split('WHERE')[0], (
+            'Проверьте, что при повторной регистрации обновляется только '
+            'код подтверждения.'
+        )
+        user = django_user_model.objects.get()
+        assert user.confirmation_code != first_code
+
+    def test_02_taken_fields(self, client, user):
+        response, _ = self.signup(
+            client,
+            {'email': user.email, 'username': 'other_username'},
+            HTTPStatus.BAD_REQUEST,
+        )
+        assert 'non_field_errors' in response.json(), (
+            'Проверьте, что занятый email возвращает ошибку как раньше.'
+        )
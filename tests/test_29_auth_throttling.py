@@ -0,0 +1,60 @@
+from http import HTTPStatus
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+
+@pytest.mark.django_db(transaction=True)
+class Test29AuthThrottling:
+
+    URL_SIGNUP = '/api/v1/auth/signup/'
+    URL_TOKEN = '/api/v1/auth/token/'
+
+    @pytest.fixture(autouse=True)
+    def rates(self, settings):
+        settings.REST_FRAMEWORK = {
+            **settings.REST_FRAMEWORK,
+            'DEFAULT_THROTTLE_RATES': {'signup': '2/min', 'token': '3/min'},
+        }
+
+    def test_01_signup_limited_by_identity(self, client):
+        data = {'email': 'valid@yamdb.fake', 'username': 'valid_username'}
+        for _ in range(2):
+            response = client.post(self.URL_SIGNUP, data=data)
+            assert response.status_code == HTTPStatus.OK
+        with CaptureQueriesContext(connection) as context:
+            response = client.post(
+                self.URL_SIGNUP, data=data, REMOTE_ADDR='10.0.0.2'
+            )
+        assert response.status_code == HTTPStatus.TOO_MANY_REQUESTS, (
+            'Проверьте, что повторные регистрации с тем же username и email '
+            'ограничиваются независимо от адреса клиента.'
+        )
+        assert 'Retry-After' in response
+        assert not context.captured_queries, (
+            'Проверьте, что отклонённый запрос не обращается к БД.'
+        )
+
+    def test_02_limited_by_ip(self, client, user):
+        for idx in range(3):
+            response = client.post(
+                self.URL_TOKEN,
+                data={'username': f'user{idx}', 'confirmation_code': 'code'}
+            )
+            assert response.status_code == HTTPStatus.NOT_FOUND
+        response = client.post(
+            self.URL_TOKEN,
+            data={'username': user.username, 'confirmation_code': 'code'}
+        )
+        assert response.status_code == HTTPStatus.TOO_MANY_REQUESTS, (
+            'Проверьте, что запросы токена ограничиваются по адресу клиента.'
+        )
+        response = client.post(
+            self.URL_SIGNUP,
+            data={'email': 'valid@yamdb.fake', 'username': 'valid_username'}
+        )
+        assert response.status_code == HTTPStatus.OK, (
+            'Проверьте, что ограничения заданы отдельно для каждого '
+            'эндпоинта.'
+        )
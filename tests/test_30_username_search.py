@@ -0,0 +1,56 @@
+from http import HTTPStatus
+
+import pytest
+from django.db import connection
+
+from custom_users.filters import PrefixSearchFilter
+
+
+@pytest.mark.django_db(transaction=True)
+class Test30UsernameSearch:
+
+    USERS_URL = '/api/v1/users/'
+    AUTOCOMPLETE_URL = '/api/v1/users/autocomplete/'
+
+    def test_01_substring_search(self, admin_client, admin, user, moderator):
+        response = admin_client.get(self.USERS_URL, {'search': 'estm'})
+        assert response.status_code == HTTPStatus.OK
+        assert [
+            item['username'] for item in response.json()['results']
+        ] == [moderator.username], (
+            'Проверьте, что `?search=` в списке пользователей по-прежнему '
+            'ищет по вхождению в username без учёта регистра.'
+        )
+
+    def test_02_prefix_search_uses_index(self, django_user_model):
+        queryset = django_user_model.objects.all()
+        query = PrefixSearchFilter().get_search_query('^username', 'Test')
+        sql, params = (
+            queryset.filter(query).values('id').query.sql_with_params()
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(f'EXPLAIN QUERY PLAN {sql}', params)
+            plan = ' '.join(str(row[-1]) for row in cursor.fetchall())
+        assert 'INDEX' in plan and 'username' in plan, (
+            'Проверьте, что поиск по началу username использует индекс.'
+        )
+
+    def test_03_autocomplete(self, admin_client, user_client, admin, user,
+                             moderator):
+        response = admin_client.get(self.AUTOCOMPLETE_URL, {'search': 'Test'})
+        assert response.status_code == HTTPStatus.OK
+        assert response.json() == sorted(
+            [admin.username, user.username, moderator.username]
+        ), (
+            'Проверьте, что автодополнение возвращает только имена '
+            'пользователей по алфавиту.'
+        )
+        response = admin_client.get(self.AUTOCOMPLETE_URL, {'search': 'TestU'})
+        assert response.json() == [user.username]
+        response = admin_client.get(self.AUTOCOMPLETE_URL, {'search': 'estU'})
+        assert response.json() == [], (
+            'Проверьте, что автодополнение ищет только по началу username.'
+        )
+
+        response = user_client.get(self.AUTOCOMPLETE_URL, {'search': 'Test'})
+        assert response.status_code == HTTPStatus.FORBIDDEN
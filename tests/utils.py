@@ -1,5 +1,10 @@
 from http import HTTPStatus
 
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+from reviews.models import Category, Genre, Title
+
 check_name_and_slug_patterns = (
     (
         {
@@ -304,3 +309,40 @@ def check_fields(obj_type, url_pattern, obj, expected_data, detail=False):
         f'данные {obj_types[obj_type]}{results_in_msg}. Поле `id` не '
         'найдено или не является целым числом.'
     )
+
+
+def create_titles_bulk(count):
+    category, _ = Category.objects.get_or_create(
+        name='Фильм', slug='films'
+    )
+    genres = [
+        Genre.objects.get_or_create(name=slug, slug=slug)[0]
+        for slug in ('horror', 'comedy')
+    ]
+    for idx in range(count):
+        title = Title.objects.create(
+            name=f'Произведение {idx}', year=2000, category=category
+        )
+        title.genre.set(genres)
+
+
+def count_queries(client, url, expected_status=HTTPStatus.OK, **extra):
+    with CaptureQueriesContext(connection) as context:
+        response = client.get(url, **extra)
+    assert response.status_code == expected_status
+    return len(context.captured_queries)
+
+
+def get_claims_client(client, user):
+    user.confirmation_code = 'code'
+    user.save()
+    response = client.post(
+        '/api/v1/auth/token/',
+        data={'username': user.username, 'confirmation_code': 'code'}
+    )
+    assert response.status_code == HTTPStatus.OK
+    claims_client = APIClient()
+    claims_client.credentials(
+        HTTP_AUTHORIZATION=f'Bearer {response.json()["token"]}'
+    )
+    return claims_client